@@ -1,5 +1,4 @@
 import hmac
-import hashlib
 import logging
 import time
 from dataclasses import dataclass
@@ -7,20 +6,57 @@ from typing import Literal
 
 import httpx
 
-from .core.requests import Request, Extractor
-from .exceptions import PhemexError, raise_for_business_error
+from .core.json import loads
+from .core.requests import Request, extract
+from .exceptions import PhemexError, RateLimitExceededError, ValidationError, raise_for_business_error
 
 from .usdm_rest import USDMRest, AsyncUSDMRest
 
 logger = logging.getLogger(__name__)
 
-_SENSITIVE_HEADERS = {"x-phemex-access-token", "x-phemex-request-signature"}
 _EXPIRY = 60  # default expiry time in seconds for request signatures
 
 PhemexKind = Literal["vip", "public", "test"]
 
 _LOW_REMAINING_THRESHOLD = 5
 
+# Connection defaults: keep TLS connections warm between bursts of requests
+# so only the first call per connection pays the handshake.
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=60)
+_DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+
+def _sign(template: hmac.HMAC, *parts: bytes) -> str:
+    """
+    HMAC-SHA256 hex signature over the concatenation of parts. The template is
+    keyed once per client (OpenSSL-backed, so SHA-NI is used where the CPU
+    supports it); copying it skips re-deriving the ipad/opad key blocks. One update()
+    over the joined parts measured faster than an update() per part.
+    """
+    h = template.copy()
+    h.update(b"".join(parts))
+    # hexdigest() is hex-encoded inside OpenSSL's HMAC object; measured faster than digest().hex()
+    return h.hexdigest()
+
+
+def _int_header(headers: httpx.Headers, name: str) -> int | None:
+    val = headers.get(name)
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _retry_after_seconds(headers: httpx.Headers) -> float | None:
+    """Retry delay carried by one response, in seconds, from whichever retry header it has."""
+    retry_after_ms = _int_header(headers, "x-ratelimit-retry-after-milliseconds")
+    if retry_after_ms is not None:
+        return retry_after_ms / 1000
+    retry_after = _int_header(headers, "retry-after")
+    return float(retry_after) if retry_after is not None else None
+
 
 @dataclass
 class RateLimitInfo:
@@ -42,87 +78,107 @@ class BasePhemexClient:
     """
 
     def __init__(self, kind: PhemexKind, api_key: str, api_secret: str):
+        if kind not in _BASE_URLS:
+            raise ValidationError(
+                message=f"Unknown Phemex kind {kind!r}",
+                context={"kind": kind, "available_kinds": list(_BASE_URLS)},
+            )
         self.base_url = _BASE_URLS[kind]
         self.api_key = api_key
         self.api_secret = api_secret.encode()
+        self._hmac_template = hmac.new(self.api_secret, digestmod="sha256")
+        self._header_template = {"x-phemex-access-token": api_key}
         self.rate_limit = RateLimitInfo()
 
-    def _prepare(self, req: Request) -> tuple[str, dict, bytes | None]:
+    def _prepare(self, req: Request) -> tuple[str, dict, bytes | None, str]:
         """
         Build the URL, signed headers, and encoded body for a request.
 
-        :return: (url, headers, content)
+        :return: (url, headers, content, body_json)
         """
+        # built on every send, so a request mutated or copied after a previous send signs its current contents
         query = req.build_query_string()
         body_json = req.build_body_json()
 
-        expires = int(time.time()) + _EXPIRY
-        parts = [req.path]
-        if query:
-            parts.append(query)
-        parts.append(str(expires))
-        if body_json:
-            parts.append(body_json)
+        content = body_json.encode("utf-8") if body_json else None
 
-        payload = "".join(parts)
-        signature = hmac.new(
-            self.api_secret,
-            payload.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        # sign the UTF-8 bytes directly and reuse the encoded body as the request content;
+        # path and body may carry non-ASCII text (orjson writes raw UTF-8), the query is
+        # percent-encoded and the expiry is digits, so both of those are plain ASCII
+        expires = str(time.time_ns() // 1_000_000_000 + _EXPIRY)
+        signature = _sign(
+            self._hmac_template,
+            req.path.encode("utf-8"),
+            query.encode("ascii"),
+            expires.encode("ascii"),
+            content or b"",
+        )
 
         headers = {
-            "x-phemex-access-token": self.api_key,
-            "x-phemex-request-expiry": str(expires),
+            **self._header_template,
+            "x-phemex-request-expiry": expires,
             "x-phemex-request-signature": signature,
         }
 
-        url = f"{self.base_url}{req.path}"
+        url = self.base_url + req.path
         if query:
-            url = f"{url}?{query}"
+            url += "?" + query
 
         if body_json:
             headers["Content-Type"] = "application/json"
 
-        safe_headers = {k: v for k, v in headers.items() if k not in _SENSITIVE_HEADERS}
-        logger.debug("REQUEST")
-        logger.debug(f"Request: {req.method} {url}")
-        logger.debug(f"Headers: {safe_headers}")
-        logger.debug(f"Body: {body_json or None}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # only the expiry and content type are safe to log; never the key or signature
+            safe_headers = {"x-phemex-request-expiry": expires}
+            if body_json:
+                safe_headers["Content-Type"] = headers["Content-Type"]
+            logger.debug("REQUEST")
+            logger.debug(f"Request: {req.method} {url}")
+            logger.debug(f"Headers: {safe_headers}")
+            logger.debug(f"Body: {body_json or None}")
 
-        content = body_json.encode("utf-8") if body_json else None
-        return url, headers, content
+        return url, headers, content, body_json
 
     def _handle_response(self, resp: httpx.Response, req: Request, url: str, body_json: str | None):
         """
         Raise PhemexError on HTTP errors and return parsed JSON on success.
         """
-        logger.debug("RESPONSE")
-        logger.debug(f"Status Code: {resp.status_code}")
-        logger.debug(f"Response Text: {resp.text}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RESPONSE")
+            logger.debug(f"Status Code: {resp.status_code}")
+            logger.debug(f"Response Text: {resp.text}")
 
         self._parse_rate_limit_headers(resp)
 
         try:
             resp.raise_for_status()
         except httpx.HTTPStatusError as e:
+            context = {
+                "request": {
+                    "method": req.method,
+                    "url": url,
+                    "body": body_json or None,
+                },
+                "response": {
+                    "status_code": resp.status_code,
+                    "text": resp.text,
+                },
+            }
+            if resp.status_code == 429:
+                # typed so callers can back off; retry policy stays with the caller
+                raise RateLimitExceededError(
+                    code=429,
+                    msg="Too Many Requests",
+                    cause=e,
+                    context={**context, "retry_after": _retry_after_seconds(resp.headers)},
+                )
             raise PhemexError(
                 message="Phemex API request failed",
                 cause=e,
-                context={
-                    "request": {
-                        "method": req.method,
-                        "url": url,
-                        "body": body_json or None,
-                    },
-                    "response": {
-                        "status_code": resp.status_code,
-                        "text": resp.text,
-                    },
-                }
+                context=context,
             )
 
-        data = resp.json()
+        data = loads(resp.content)
         raise_for_business_error(data)
         return data
 
@@ -130,18 +186,9 @@ class BasePhemexClient:
         """Parse x-ratelimit-* headers and store on client instance."""
         headers = resp.headers
 
-        def _int_header(name: str) -> int | None:
-            val = headers.get(name)
-            if val is None:
-                return None
-            try:
-                return int(val)
-            except (ValueError, TypeError):
-                return None
-
-        limit = _int_header("x-ratelimit-limit")
-        remaining = _int_header("x-ratelimit-remaining")
-        retry_after = _int_header("x-ratelimit-retry-after-milliseconds") or _int_header("retry-after")
+        limit = _int_header(headers, "x-ratelimit-limit")
+        remaining = _int_header(headers, "x-ratelimit-remaining")
+        retry_after = _int_header(headers, "x-ratelimit-retry-after-milliseconds") or _int_header(headers, "retry-after")
 
         if limit is not None:
             self.rate_limit.limit = limit
@@ -150,7 +197,7 @@ class BasePhemexClient:
         if retry_after is not None:
             self.rate_limit.retry_after = retry_after
 
-        logger.debug(f"Rate limit: {self.rate_limit}")
+        logger.debug("Rate limit: %s", self.rate_limit)
 
         if remaining is not None and remaining <= _LOW_REMAINING_THRESHOLD:
             logger.warning(f"Phemex rate limit low: {remaining}/{limit or '?'} remaining")
@@ -161,9 +208,18 @@ class PhemexClient(BasePhemexClient):
     Sync client for Phemex API (https://phemex-docs.github.io/). Built using httpx.Client.
     """
 
-    def __init__(self, kind: PhemexKind, api_key: str, api_secret: str):
+    def __init__(
+        self,
+        kind: PhemexKind,
+        api_key: str,
+        api_secret: str,
+        *,
+        http2: bool = True,
+        limits: httpx.Limits = _DEFAULT_LIMITS,
+        timeout: httpx.Timeout = _DEFAULT_TIMEOUT,
+    ):
         super().__init__(kind, api_key, api_secret)
-        self.session = httpx.Client()
+        self.session = httpx.Client(http2=http2, limits=limits, timeout=timeout)
         self.usdm_rest = USDMRest(self)
 
     def __enter__(self):
@@ -183,9 +239,9 @@ class PhemexClient(BasePhemexClient):
         :param req: Request object
         :return: Parsed JSON response.
         """
-        url, headers, content = self._prepare(req)
+        url, headers, content, body_json = self._prepare(req)
         resp = self.session.request(method=req.method, url=url, headers=headers, content=content)
-        return self._handle_response(resp, req, url, req.build_body_json())
+        return self._handle_response(resp, req, url, body_json)
 
     # ----------------------------------------
     # Common endpoints shared across APIs
@@ -198,7 +254,7 @@ class PhemexClient(BasePhemexClient):
         """
         req = Request.get("/public/time")
         resp = self.request(req)
-        timestamp = Extractor(resp).key("data", "serverTime").extract()
+        timestamp = extract(resp, "data", "serverTime")
         return timestamp if ms else timestamp // 1000
 
 
@@ -207,9 +263,18 @@ class AsyncPhemexClient(BasePhemexClient):
     Async client for Phemex API (https://phemex-docs.github.io/). Built using httpx.AsyncClient.
     """
 
-    def __init__(self, kind: PhemexKind, api_key: str, api_secret: str):
+    def __init__(
+        self,
+        kind: PhemexKind,
+        api_key: str,
+        api_secret: str,
+        *,
+        http2: bool = True,
+        limits: httpx.Limits = _DEFAULT_LIMITS,
+        timeout: httpx.Timeout = _DEFAULT_TIMEOUT,
+    ):
         super().__init__(kind, api_key, api_secret)
-        self.session = httpx.AsyncClient()
+        self.session = httpx.AsyncClient(http2=http2, limits=limits, timeout=timeout)
         self.usdm_rest = AsyncUSDMRest(self)
 
     async def __aenter__(self):
@@ -229,9 +294,9 @@ class AsyncPhemexClient(BasePhemexClient):
         :param req: Request object
         :return: Parsed JSON response.
         """
-        url, headers, content = self._prepare(req)
+        url, headers, content, body_json = self._prepare(req)
         resp = await self.session.request(method=req.method, url=url, headers=headers, content=content)
-        return self._handle_response(resp, req, url, req.build_body_json())
+        return self._handle_response(resp, req, url, body_json)
 
     # ----------------------------------------
     # Common endpoints shared across APIs
@@ -244,5 +309,5 @@ class AsyncPhemexClient(BasePhemexClient):
         """
         req = Request.get("/public/time")
         resp = await self.request(req)
-        timestamp = Extractor(resp).key("data", "serverTime").extract()
+        timestamp = extract(resp, "data", "serverTime")
         return timestamp if ms else timestamp // 1000
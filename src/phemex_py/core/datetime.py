@@ -1,24 +1,44 @@
 import datetime
+import re
+import time
+from collections.abc import Iterable
 from enum import IntEnum
 
 
+_UTC = datetime.timezone.utc
+_fromtimestamp = datetime.datetime.fromtimestamp
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+_ONE_MS = datetime.timedelta(milliseconds=1)
+_ONE_SECOND = datetime.timedelta(seconds=1)
+
+# Plain-int durations in milliseconds for internal arithmetic, avoiding enum
+# member lookups on hot paths. MS below is the public, named form.
+_MS_SECOND = 1000
+_MS_MINUTE = 60 * _MS_SECOND
+_MS_HOUR = 60 * _MS_MINUTE
+_MS_DAY = 24 * _MS_HOUR
+_MS_WEEK = 7 * _MS_DAY
+_MS_MONTH = 30 * _MS_DAY
+_MS_YEAR = 365 * _MS_DAY
+
+
 class MS(IntEnum):
     """
     Time durations in milliseconds.
     """
-    SECOND = 1000
-    MINUTE = 60 * SECOND
-    HOUR = 60 * MINUTE
-    DAY = 24 * HOUR
-    WEEK = 7 * DAY
-    MONTH = 30 * DAY
-    YEAR = 365 * DAY
+    SECOND = _MS_SECOND
+    MINUTE = _MS_MINUTE
+    HOUR = _MS_HOUR
+    DAY = _MS_DAY
+    WEEK = _MS_WEEK
+    MONTH = _MS_MONTH
+    YEAR = _MS_YEAR
 
 
 def unix_now(ms: bool = True) -> int:
     """Get the current Unix timestamp (in seconds or milliseconds)."""
-    now = datetime.datetime.now(datetime.timezone.utc)
-    return datetime_to_unix(now, ms=ms)
+    now_ns = time.time_ns()  # integer clock read, no datetime/tzinfo round-trip
+    return now_ns // 1_000_000 if ms else now_ns // 1_000_000_000
 
 
 def unix_to_datetime(timestamp: int, ms: bool = True) -> datetime.datetime:
@@ -26,7 +46,7 @@ def unix_to_datetime(timestamp: int, ms: bool = True) -> datetime.datetime:
     if ms:
         timestamp //= 1000
 
-    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc)
+    return _fromtimestamp(timestamp, tz=_UTC)
 
 
 def unix_to_iso(timestamp: int, ms: bool = True) -> str:
@@ -40,7 +60,7 @@ def datetime_to_iso(dt: datetime.datetime) -> str:
     if dt.tzinfo is None:
         raise ValueError("Datetime object must be timezone-aware")
 
-    return dt.astimezone(datetime.timezone.utc).isoformat()
+    return dt.astimezone(_UTC).isoformat()
 
 
 def datetime_to_unix(dt: datetime.datetime, ms: bool = True) -> int:
@@ -48,23 +68,50 @@ def datetime_to_unix(dt: datetime.datetime, ms: bool = True) -> int:
     if dt.tzinfo is None:
         raise ValueError("Datetime object must be timezone-aware")
 
-    timestamp = dt.timestamp()
-
+    # integer timedelta division: exact, and skips timestamp()'s float path
     if ms:
-        return int(timestamp * 1000)
+        return (dt - _EPOCH) // _ONE_MS
 
-    return int(timestamp)
+    return (dt - _EPOCH) // _ONE_SECOND
+
+
+# The fixed 'YYYY-MM-DDTHH:MM:SS.sssZ' shape Phemex returns. ASCII digits only: int() alone
+# would also accept signs, spaces and underscores inside the slices.
+_is_phemex_iso = re.compile(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}Z", re.ASCII).fullmatch
 
 
 def iso_to_datetime(iso_str: str) -> datetime.datetime:
     """Convert an ISO 8601 string to a timezone-aware datetime object in UTC."""
+    if _is_phemex_iso(iso_str):
+        # fixed-shape fast path, skips fromisoformat's general grammar
+        return datetime.datetime(
+            int(iso_str[0:4]), int(iso_str[5:7]), int(iso_str[8:10]),
+            int(iso_str[11:13]), int(iso_str[14:16]), int(iso_str[17:19]),
+            int(iso_str[20:23]) * 1000,
+            tzinfo=_UTC,
+        )
+
     dt = datetime.datetime.fromisoformat(iso_str)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=datetime.timezone.utc)
-    return dt.astimezone(datetime.timezone.utc)
+        dt = dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
 def iso_to_unix(iso_str: str, ms: bool = True) -> int:
     """Convert an ISO 8601 string to a Unix timestamp (in seconds or milliseconds)."""
     dt = iso_to_datetime(iso_str)
     return datetime_to_unix(dt, ms=ms)
+
+
+def unix_to_iso_batch(timestamps: Iterable[int], ms: bool = True) -> list[str]:
+    """
+    Convert many Unix timestamps (e.g. a column of kline times) to ISO 8601 strings in UTC.
+    Equivalent to calling unix_to_iso per element, without the per-call overhead.
+    """
+    divisor = 1000 if ms else 1
+    return [_fromtimestamp(ts // divisor, tz=_UTC).isoformat() for ts in timestamps]
+
+
+def iso_to_unix_batch(iso_strs: Iterable[str], ms: bool = True) -> list[int]:
+    """Convert many ISO 8601 strings to Unix timestamps (in seconds or milliseconds)."""
+    return [iso_to_unix(iso_str, ms=ms) for iso_str in iso_strs]
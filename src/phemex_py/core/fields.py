@@ -1,51 +1,151 @@
-from abc import ABC
-from pydantic import Field
+"""
+Reusable field metadata for Phemex API models. Each field sets a single pydantic `alias`
+(the exchange's field name), which pydantic uses for both validation and serialization.
+"""
+import sys
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import AfterValidator, Field
 
 from .models import options, PhemexScale
 
+_SCALE_VALUE = PhemexScale.value()
+_SCALE_PRICE = PhemexScale.price()
+_SCALE_RATIO = PhemexScale.ratio()
 
-class FieldInfo(ABC):
+# Option sets shared verbatim by several fields
+_TRIGGER_TYPES = (
+    "ByMarkPrice",
+    "ByIndexPrice",
+    "ByLastPrice",
+    "ByAskPrice",
+    "ByBidPrice",
+    "ByMarkPriceLimit",
+    "ByLastPriceLimit"
+)
+
+
+class _FieldMeta(type):
+    """
+    Calling a FieldInfo subclass, e.g. User.ID("userID"), returns its cached
+    metadata tuple directly instead of going through type.__call__/__new__.
+    """
+    __slots__ = ()
+
+    def __call__(cls, alias: str, scaled: bool = False, alt: bool = False) -> tuple:
+        alias = sys.intern(alias)  # aliases become pydantic lookup keys on every validation
+        key = (cls, alias, scaled, alt)
+        parts = _FIELD_CACHE.get(key)
+        if parts is None:
+            parts = _FIELD_CACHE[key] = cls._build(alias, scaled, alt)
+        return parts
+
+
+class FieldInfo(metaclass=_FieldMeta):
     """
     Base class for defining Phemex API fields with metadata.
     Used to help reduce boilerplate when defining many fields.
     """
-    field: dict  # pydantic field info as dict
-    options: list[str] | None = None  # optional options for str fields
+    __slots__ = ()
+    field: Mapping[str, Any]  # pydantic field info, frozen to a read-only mapping per subclass
+    options: tuple[str, ...] | None = None  # optional options for str fields
     scale: PhemexScale | None = None
-
-    def __new__(cls, alias: str, scaled: bool = False, alt: bool = False) -> tuple:
-        """When called, return the tuple of metadata instead of an instance."""
-        info = {**cls.field}
+    _opts: AfterValidator | None = None  # options validator, built once per subclass
+    _tail: tuple = ()  # metadata following the Field, unscaled
+    _scaled_tail: tuple = ()  # metadata following the Field, scaled
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        field = cls.__dict__.get("field")
+        if isinstance(field, dict):
+            cls.field = _frozen_info(field)
+        cls._opts = _options_validator(cls.options) if cls.options else None
+        cls._tail = (cls._opts,) if cls._opts is not None else ()
+        cls._scaled_tail = cls._tail + (cls.scale,) if cls.scale else cls._tail
+
+    @classmethod
+    def _build(cls, alias: str, scaled: bool, alt: bool) -> tuple:
+        """Build the metadata tuple; only runs once per unique (cls, alias, scaled, alt)."""
         if alt:
-            info["title"] = f"Alternative {info.get('title', alias)}"
-            info["description"] = f"{info.get('description', alias)} (alternative provided by Phemex)"
-        field = Field(serialization_alias=alias, validation_alias=alias, **info)
-        parts = [field]
-        if cls.options:
-            defaults = [None, "", "UNSPECIFIED"]
-            opts = options(*defaults, *cls.options)
-            parts.append(opts)
-        if cls.scale and scaled:
-            parts.append(cls.scale)
-        return tuple(parts)
+            field = cls._alt_field(alias)
+        else:
+            field = _pooled_field(alias, cls.field)
+        return (field, *(cls._scaled_tail if scaled else cls._tail))
+
+    @classmethod
+    def _alt_field(cls, alias: str):
+        """The "Alternative" Field depends only on (cls, alias), so scaled/unscaled variants share it."""
+        field = _ALT_FIELDS.get((cls, alias))
+        if field is None:
+            info = cls.field | {
+                "title": f"Alternative {cls.field.get('title', alias)}",
+                "description": f"{cls.field.get('description', alias)} (alternative provided by Phemex)",
+            }
+            field = _ALT_FIELDS[(cls, alias)] = _pooled_field(alias, info)
+        return field
+
+
+# Metadata tuples are immutable and depend only on the call signature, so
+# models sharing a field reuse one tuple instead of rebuilding it.
+_FIELD_CACHE: dict[tuple[type[FieldInfo], str, bool, bool], tuple] = {}
+_ALT_FIELDS: dict[tuple[type[FieldInfo], str], Any] = {}
+# Fields with identical alias and metadata (e.g. the same title/description
+# declared on two classes) share a single pydantic Field.
+_FIELD_POOL: dict[tuple[str, frozenset], Any] = {}
+
+
+# Subclasses declaring the same title/description share one read-only mapping.
+_FIELD_INFOS: dict[frozenset, Mapping[str, Any]] = {}
+
+
+def _frozen_info(info: dict[str, Any]) -> Mapping[str, Any]:
+    key = frozenset(info.items())
+    frozen = _FIELD_INFOS.get(key)
+    if frozen is None:
+        frozen = _FIELD_INFOS[key] = MappingProxyType(info)
+    return frozen
+
+
+@lru_cache(maxsize=None)
+def _options_validator(opts: tuple[str, ...]) -> AfterValidator:
+    """Fields with the same options share one validator."""
+    return options(None, "", "UNSPECIFIED", *opts)
+
+
+def _pooled_field(alias: str, info: Mapping[str, Any]) -> Any:
+    key = (alias, frozenset(info.items()))
+    field = _FIELD_POOL.get(key)
+    if field is None:
+        field = _FIELD_POOL[key] = Field(alias=alias, **info)
+    return field
+
+
+@lru_cache(maxsize=None)
+def _nested(alias: str) -> Any:
+    alias = sys.intern(alias)
+    return Field(
+        alias=alias,
+        title=f"Nested {alias}",
+        description=f"Nested model for {alias}"
+    )
 
 
 class NestedModel:
+    __slots__ = ()
+
     def __new__(cls, alias: str) -> type[Field]:
-        """When called, return the tuple of metadata instead of an instance."""
-        return Field(
-            serialization_alias=alias,
-            validation_alias=alias,
-            title=f"Nested {alias}",
-            description=f"Nested model for {alias}"
-        )
+        """When called, return the (cached) Field metadata instead of an instance."""
+        return _nested(alias)
 
 
 class ErrorCode(FieldInfo):
-    field = dict(
-        title="Error code",
-        description="Phemex error code, 0 if no error"
-    )
+    field = {
+        "title": "Error code",
+        "description": "Phemex error code, 0 if no error"
+    }
 
 
 class User:
@@ -54,16 +154,16 @@ class User:
     """
 
     class ID(FieldInfo):
-        field = dict(
-            title="User ID",
-            description="Phemex user ID"
-        )
+        field = {
+            "title": "User ID",
+            "description": "Phemex user ID"
+        }
 
     class Mode(FieldInfo):
-        field = dict(
-            title="User Mode",
-            description="User mode: Normal or Liquidation"
-        )
+        field = {
+            "title": "User Mode",
+            "description": "User mode: Normal or Liquidation"
+        }
 
 
 class Account:
@@ -72,16 +172,16 @@ class Account:
     """
 
     class ID(FieldInfo):
-        field = dict(
-            title="Account ID",
-            description="Phemex sub-account ID"
-        )
+        field = {
+            "title": "Account ID",
+            "description": "Phemex sub-account ID"
+        }
 
     class Status(FieldInfo):
-        field = dict(
-            title="Account Status",
-            description="Status of the account"
-        )
+        field = {
+            "title": "Account Status",
+            "description": "Status of the account"
+        }
 
 
 class AccountBalance:
@@ -90,22 +190,22 @@ class AccountBalance:
     """
 
     class Bonus(FieldInfo):
-        field = dict(
-            title="Bonus Balance",
-            description="Bonus balance that can be used for trading but not withdrawn"
-        )
+        field = {
+            "title": "Bonus Balance",
+            "description": "Bonus balance that can be used for trading but not withdrawn"
+        }
 
     class Used(FieldInfo):
-        field = dict(
-            title="Used Balance",
-            description="Total balance currently used as margin for open positions and orders"
-        )
+        field = {
+            "title": "Used Balance",
+            "description": "Total balance currently used as margin for open positions and orders"
+        }
 
     class Total(FieldInfo):
-        field = dict(
-            title="Total Balance",
-            description="Total account balance including used margin"
-        )
+        field = {
+            "title": "Total Balance",
+            "description": "Total account balance including used margin"
+        }
 
 
 class Action:
@@ -114,136 +214,136 @@ class Action:
     """
 
     class Name(FieldInfo):
-        field = dict(
-            title="Action",
-            description="Action taken on the order"
-        )
+        field = {
+            "title": "Action",
+            "description": "Action taken on the order"
+        }
 
     class Code(FieldInfo):
         """
         New(1), Cancel(2), Replace(3), CancelAll(4),SettleFundingFee(13)
         """
-        field = dict(
-            title="Action Code",
-            description="Numeric code representing the action taken"
-        )
+        field = {
+            "title": "Action Code",
+            "description": "Numeric code representing the action taken"
+        }
 
     class User(FieldInfo):
         """
         ByUser(1)
         """
-        field = dict(
-            title="Action By Code",
-            description="Numeric code representing who initiated the action"
-        )
+        field = {
+            "title": "Action By Code",
+            "description": "Numeric code representing who initiated the action"
+        }
 
 
 class Currency(FieldInfo):
     """
     Fields relating to currency information. To use "standard" currency, just invoke the base of this class.
     """
-    field = dict(
-        title="Currency Symbol",
-        description="Symbol code of the currency (e.g., BTC, ETH)"
-    )
+    field = {
+        "title": "Currency Symbol",
+        "description": "Symbol code of the currency (e.g., BTC, ETH)"
+    }
 
     class Display(FieldInfo):
-        field = dict(
-            title="Display Currency",
-            description="Currency symbol used for display, often same as main currency symbol"
-        )
+        field = {
+            "title": "Display Currency",
+            "description": "Currency symbol used for display, often same as main currency symbol"
+        }
 
     class Base(FieldInfo):
-        field = dict(
-            title="Base Currency",
-            description="Base currency of the trading pair"
-        )
+        field = {
+            "title": "Base Currency",
+            "description": "Base currency of the trading pair"
+        }
 
     class Quote(FieldInfo):
-        field = dict(
-            title="Quote Currency",
-            description="Currency in which the contract is quoted"
-        )
+        field = {
+            "title": "Quote Currency",
+            "description": "Currency in which the contract is quoted"
+        }
 
     class Settle(FieldInfo):
-        field = dict(
-            title="Settlement Currency",
-            description="Currency in which the contract is settled"
-        )
+        field = {
+            "title": "Settlement Currency",
+            "description": "Currency in which the contract is settled"
+        }
 
     class PerpetualFlag(FieldInfo):
-        field = dict(
-            title="Perpetual Contract Flag",
-            description="Flag indicating whether the currency is associated with perpetual contracts (1 = yes)"
-        )
+        field = {
+            "title": "Perpetual Contract Flag",
+            "description": "Flag indicating whether the currency is associated with perpetual contracts (1 = yes)"
+        }
 
     class StableCoinFlag(FieldInfo):
-        field = dict(
-            title="Stablecoin Flag",
-            description="Flag indicating whether the currency is a stablecoin (1 = stablecoin)"
-        )
+        field = {
+            "title": "Stablecoin Flag",
+            "description": "Flag indicating whether the currency is a stablecoin (1 = stablecoin)"
+        }
 
 
 class Funding:
     class Fee(FieldInfo):
-        field = dict(
-            title="Funding Fee",
-            description="Funding fee paid or received at the last funding timestamp"
-        )
+        field = {
+            "title": "Funding Fee",
+            "description": "Funding fee paid or received at the last funding timestamp"
+        }
 
     class FeeRate(FieldInfo):
-        field = dict(
-            title="Fee Rate",
-            description="Fee rate applied to this order"
-        )
+        field = {
+            "title": "Fee Rate",
+            "description": "Fee rate applied to this order"
+        }
 
     class Rate(FieldInfo):
-        field = dict(
-            title="Funding Rate",
-            description="Current funding rate"
-        )
+        field = {
+            "title": "Funding Rate",
+            "description": "Current funding rate"
+        }
 
     class RateCap(FieldInfo):
-        field = dict(
-            title="Funding Rate Cap",
-            description="Maximum allowable funding rate"
-        )
+        field = {
+            "title": "Funding Rate Cap",
+            "description": "Maximum allowable funding rate"
+        }
 
     class RateFloor(FieldInfo):
-        field = dict(
-            title="Funding Rate Floor",
-            description="Minimum allowable funding rate"
-        )
+        field = {
+            "title": "Funding Rate Floor",
+            "description": "Minimum allowable funding rate"
+        }
 
     class InterestRate(FieldInfo):
-        field = dict(
-            title="Interest Rate",
-            description="Interest rate applied to the position"
-        )
+        field = {
+            "title": "Interest Rate",
+            "description": "Interest rate applied to the position"
+        }
 
     class Interval(FieldInfo):
-        field = dict(
-            title="Funding Interval",
-            description="Interval in seconds between funding payments"
-        )
+        field = {
+            "title": "Funding Interval",
+            "description": "Interval in seconds between funding payments"
+        }
 
     class NextFundingTime(FieldInfo):
-        field = dict(
-            title="Next Funding Time",
-            description="Timestamp in milliseconds for the next funding event"
-        )
+        field = {
+            "title": "Next Funding Time",
+            "description": "Timestamp in milliseconds for the next funding event"
+        }
 
     class RemainingFundingTime(FieldInfo):
-        field = dict(
-            title="Time Remaining Until Next Funding",
-            description="Time in seconds until the next funding event"
-        )
+        field = {
+            "title": "Time Remaining Until Next Funding",
+            "description": "Time in seconds until the next funding event"
+        }
 
     class PredictedFundingRate(FieldInfo):
-        field = dict(
-            title="Predicted Funding Rate",
-            description="Predicted next funding rate"
-        )
+        field = {
+            "title": "Predicted Funding Rate",
+            "description": "Predicted next funding rate"
+        }
 
 
 class Order:
@@ -252,29 +352,29 @@ class Order:
     """
 
     class ID(FieldInfo):
-        field = dict(
-            title="Order ID",
-            description="Exchange assigned order ID"
-        )
+        field = {
+            "title": "Order ID",
+            "description": "Exchange assigned order ID"
+        }
 
     class ClientID(FieldInfo):
-        field = dict(
-            title="Client ID",
-            description="Client assigned order ID"
-        )
+        field = {
+            "title": "Client ID",
+            "description": "Client assigned order ID"
+        }
 
     class Details(FieldInfo):
-        field = dict(
-            title="Order Details",
-            description="Additional details about the order"
-        )
+        field = {
+            "title": "Order Details",
+            "description": "Additional details about the order"
+        }
 
     class Status(FieldInfo):
-        field = dict(
-            title="Order Status",
-            description="Current order status"
-        )
-        options = [
+        field = {
+            "title": "Order Status",
+            "description": "Current order status"
+        }
+        options = (
             "Created",  # Order acked from order request, a transient state
             "Init",  # Same as Created, order acked from order request, a transient state
             "Untriggered",  # Conditional order waiting to be triggered
@@ -285,14 +385,14 @@ class Order:
             "PartiallyFilled",  # Order partially filled
             "Filled",  # Order fully filled
             "Canceled"  # Order canceled
-        ]
+        )
 
     class OrderType(FieldInfo):
-        field = dict(
-            title="Order Type",
-            description="Order type, e.g. Limit, Market, Stop."
-        )
-        options = [
+        field = {
+            "title": "Order Type",
+            "description": "Order type, e.g. Limit, Market, Stop."
+        }
+        options = (
             "Limit",
             "LimitIfTouched",
             "Market",
@@ -307,32 +407,32 @@ class Order:
             "BoTpLimit",
             "BoSlLimit",
             "BoSlMarket"
-        ]
+        )
 
     class TradeType(FieldInfo):
-        field = dict(
-            title="Trade Type",
-            description="Type of trade execution"
-        )
+        field = {
+            "title": "Trade Type",
+            "description": "Type of trade execution"
+        }
 
     class Side(FieldInfo):
-        field = dict(
-            title="Side",
-            description="Direction of the order i.e. Buy or Sell"
-        )
-        options = ["Buy", "Sell"]
+        field = {
+            "title": "Side",
+            "description": "Direction of the order i.e. Buy or Sell"
+        }
+        options = ("Buy", "Sell")
 
     class Quantity(FieldInfo):
-        field = dict(
-            title="Quantity",
-            description="Order quantity in contracts"
-        )
+        field = {
+            "title": "Quantity",
+            "description": "Order quantity in contracts"
+        }
 
     class Price(FieldInfo):
-        field = dict(
-            title="Price",
-            description="Order price for conditional orders"
-        )
+        field = {
+            "title": "Price",
+            "description": "Order price for conditional orders"
+        }
 
 
 class OrderCode:
@@ -344,28 +444,28 @@ class OrderCode:
         """
         Buy(1), Sell(2)
         """
-        field = dict(
-            title="Order Side Code",
-            description="Numeric code representing the side of the order"
-        )
+        field = {
+            "title": "Order Side Code",
+            "description": "Numeric code representing the side of the order"
+        }
 
     class PositionSide(FieldInfo):
         """
         Merged(0), Long(1), Short(2)
         """
-        field = dict(
-            title="Position Side Code",
-            description="Numeric code representing the position side in hedge mode"
-        )
+        field = {
+            "title": "Position Side Code",
+            "description": "Numeric code representing the position side in hedge mode"
+        }
 
     class Status(FieldInfo):
         """
         Created(0),Untriggered(1),Deactivated(2),Triggered(3),Rejected(4),New(5),PartiallyFilled(6),Filled(7),Canceled(8)
         """
-        field = dict(
-            title="Order Status Code",
-            description="Numeric code representing the current order status"
-        )
+        field = {
+            "title": "Order Status Code",
+            "description": "Numeric code representing the current order status"
+        }
 
     class OrderType(FieldInfo):
         """
@@ -374,65 +474,65 @@ class OrderCode:
         MarketIfTouchedAsLimit (10), Bracket (11), BoTpLimit (12), BoSlLimit (13),
         BoSlMarket (14)
         """
-        field = dict(
-            title="Order Type Code",
-            description="Numeric code representing the order type"
-        )
+        field = {
+            "title": "Order Type Code",
+            "description": "Numeric code representing the order type"
+        }
 
     class TradeType(FieldInfo):
         """
         Trade(1), Funding(4), LiqTrade(6), AdlTrade(7)
         """
-        field = dict(
-            title="Trade Type",
-            description="Type of trade execution"
-        )
+        field = {
+            "title": "Trade Type",
+            "description": "Type of trade execution"
+        }
 
     class StopDirection(FieldInfo):
         """
         Rising (1), Falling (2)
         """
-        field = dict(
-            title="Stop Direction Code",
-            description="Numeric code representing the direction of the stop order"
-        )
+        field = {
+            "title": "Stop Direction Code",
+            "description": "Numeric code representing the direction of the stop order"
+        }
 
     class TriggerType(FieldInfo):
         """
         UNSPECIFIED(0), ByMarkPrice(1), ByLastPrice(3)
         """
-        field = dict(
-            title="Trigger Type Code",
-            description="Numeric code representing the trigger type for conditional orders"
-        )
+        field = {
+            "title": "Trigger Type Code",
+            "description": "Numeric code representing the trigger type for conditional orders"
+        }
 
     class PegType(FieldInfo):
         """
         UNSPECIFIED(0), LastPeg(1), MidPricePeg(2), MarketPeg(3),
         PrimaryPeg(4), TrailingStopPeg(5), TrailingTakeProfitPeg(6)
         """
-        field = dict(
-            title="Peg Price Type Code",
-            description="Numeric code representing the type of pegged order"
-        )
+        field = {
+            "title": "Peg Price Type Code",
+            "description": "Numeric code representing the type of pegged order"
+        }
 
     class ExecutionStatus(FieldInfo):
         """
         Aborted(2), MakerFill(6), TakerFill(7), Expired(8), Canceled(11), CreateRejected(19)
         """
-        field = dict(
-            title="Execution Status Code",
-            description="Numeric code representing the execution status of the order"
-        )
+        field = {
+            "title": "Execution Status Code",
+            "description": "Numeric code representing the execution status of the order"
+        }
 
     class ExecutionType(FieldInfo):
         """
         Trade(1),LiqTrade(6),AdlTrade(7)
         """
-        field = dict(
-            title="Execution Type Code",
-            description="Numeric code representing the type of execution"
-        )
+        field = {
+            "title": "Execution Type Code",
+            "description": "Numeric code representing the type of execution"
+        }
 
 
 class OrderCondition:
@@ -441,125 +541,109 @@ class OrderCondition:
     """
 
     class TriggerType(FieldInfo):
-        field = dict(
-            title="Trigger Type",
-            description="Trigger for conditional orders"
-        )
+        field = {
+            "title": "Trigger Type",
+            "description": "Trigger for conditional orders"
+        }
 
     class STPInstruction(FieldInfo):
-        field = dict(
-            title="STP Instruction",
-            description="Self-trade prevention (STP) instruction"
-        )
-        options = ["None", "CancelMaker", "CancelTaker", "CancelBoth"]
+        field = {
+            "title": "STP Instruction",
+            "description": "Self-trade prevention (STP) instruction"
+        }
+        options = ("None", "CancelMaker", "CancelTaker", "CancelBoth")
 
     class ReduceOnly(FieldInfo):
-        field = dict(
-            title="Reduce Only",
-            description="Whether the order should only reduce an existing position"
-        )
+        field = {
+            "title": "Reduce Only",
+            "description": "Whether the order should only reduce an existing position"
+        }
 
     class TimeInForce(FieldInfo):
-        field = dict(
-            title="Time In Force",
-            description="How long the order remains active before it is executed or expires"
-        )
-        options = ["GoodTillCancel", "ImmediateOrCancel", "FillOrKill", "PostOnly"]
+        field = {
+            "title": "Time In Force",
+            "description": "How long the order remains active before it is executed or expires"
+        }
+        options = ("GoodTillCancel", "ImmediateOrCancel", "FillOrKill", "PostOnly")
 
     class CloseOnTrigger(FieldInfo):
-        field = dict(
-            title="Close on Trigger",
-            description="If true, closes position when trigger condition is met."
-        )
+        field = {
+            "title": "Close on Trigger",
+            "description": "If true, closes position when trigger condition is met."
+        }
 
     class StopDirection(FieldInfo):
-        field = dict(
-            title="Stop Direction",
-            description="Direction of the stop order"
-        )
-        options = ["Rising", "Falling"]
+        field = {
+            "title": "Stop Direction",
+            "description": "Direction of the stop order"
+        }
+        options = ("Rising", "Falling")
 
     class StopPrice(FieldInfo):
-        field = dict(
-            title="Stop Price",
-            description="Stop order trigger price"
-        )
+        field = {
+            "title": "Stop Price",
+            "description": "Stop order trigger price"
+        }
 
     class StopLossPrice(FieldInfo):
-        field = dict(
-            title="Stop Loss Price",
-            description="Stop loss trigger price"
-        )
-        scale = PhemexScale.price()
+        field = {
+            "title": "Stop Loss Price",
+            "description": "Stop loss trigger price"
+        }
+        scale = _SCALE_PRICE
 
     class StopLossTrigger(FieldInfo):
-        field = dict(
-            title="Stop Loss Trigger Type",
-            description="Trigger for stop loss orders."
-        )
-        options = [
-            "ByMarkPrice",
-            "ByIndexPrice",
-            "ByLastPrice",
-            "ByAskPrice",
-            "ByBidPrice",
-            "ByMarkPriceLimit",
-            "ByLastPriceLimit"
-        ]
+        field = {
+            "title": "Stop Loss Trigger Type",
+            "description": "Trigger for stop loss orders."
+        }
+        options = _TRIGGER_TYPES
 
     class TakeProfitPrice(FieldInfo):
-        field = dict(
-            title="Take Profit Price",
-            description="Take profit trigger price"
-        )
-        scale = PhemexScale.price()
+        field = {
+            "title": "Take Profit Price",
+            "description": "Take profit trigger price"
+        }
+        scale = _SCALE_PRICE
 
     class TakeProfitTrigger(FieldInfo):
-        field = dict(
-            title="Take Profit Trigger Type",
-            description="Trigger for take profit orders."
-        )
-        options = [
-            "ByMarkPrice",
-            "ByIndexPrice",
-            "ByLastPrice",
-            "ByAskPrice",
-            "ByBidPrice",
-            "ByMarkPriceLimit",
-            "ByLastPriceLimit"
-        ]
+        field = {
+            "title": "Take Profit Trigger Type",
+            "description": "Trigger for take profit orders."
+        }
+        options = _TRIGGER_TYPES
 
     class PegOffsetProportion(FieldInfo):
-        field = dict(
-            title="Peg Price",
-            description="Calculated peg price for pegged orders"
-        )
+        field = {
+            "title": "Peg Price",
+            "description": "Calculated peg price for pegged orders"
+        }
 
     class PegOffsetValue(FieldInfo):
-        field = dict(
-            title="Peg Offset Value",
-            description="Offset from reference price for pegged orders"
-        )
+        field = {
+            "title": "Peg Offset Value",
+            "description": "Offset from reference price for pegged orders"
+        }
 
     class PegPrice(FieldInfo):
-        field = dict(
-            title="Peg Price",
-            description="Calculated peg price for pegged orders"
-        )
+        field = {
+            "title": "Peg Price",
+            "description": "Calculated peg price for pegged orders"
+        }
 
     class PegType(FieldInfo):
-        field = dict(
-            title="Peg Price Type",
-            description="Type of pegged order"
-        )
-        options = [
+        field = {
+            "title": "Peg Price Type",
+            "description": "Type of pegged order"
+        }
+        options = (
             "LastPeg",
             "MidPricePeg",
             "MarketPeg",
             "PrimaryPeg",
             "TrailingStopPeg",
             "TrailingTakeProfitPeg"
-        ]
+        )
 
 
 class OrderExecution:
@@ -569,17 +653,17 @@ class OrderExecution:
     """
 
     class ID(FieldInfo):
-        field = dict(
-            title="Execution ID",
-            description="Unique identifier for the execution"
-        )
+        field = {
+            "title": "Execution ID",
+            "description": "Unique identifier for the execution"
+        }
 
     class Status(FieldInfo):
-        field = dict(
-            title="Execution Status",
-            description="Execution status of the order"
-        )
-        options = [
+        field = {
+            "title": "Execution Status",
+            "description": "Execution status of the order"
+        }
+        options = (
             "Init",
             "New",
             "Aborted",
@@ -591,38 +675,38 @@ class OrderExecution:
             "PendingReplace",
             "Canceled",
             "CreateRejected"
-        ]
+        )
 
     class Instructions(FieldInfo):
-        field = dict(
-            title="Execution Instructions",
-            description="Special execution instructions. Used for special order types"
-        )
-        options = ["ReduceOnly", "CloseOnTrigger"]
+        field = {
+            "title": "Execution Instructions",
+            "description": "Special execution instructions. Used for special order types"
+        }
+        options = ("ReduceOnly", "CloseOnTrigger")
 
     class Quantity(FieldInfo):
-        field = dict(
-            title="Execution Quantity",
-            description="Quantity executed in this fill"
-        )
+        field = {
+            "title": "Execution Quantity",
+            "description": "Quantity executed in this fill"
+        }
 
     class Price(FieldInfo):
-        field = dict(
-            title="Execution Price",
-            description="Price at which the execution occurred"
-        )
+        field = {
+            "title": "Execution Price",
+            "description": "Price at which the execution occurred"
+        }
 
     class Value(FieldInfo):
-        field = dict(
-            title="Execution Value",
-            description="Nominal value of the execution"
-        )
+        field = {
+            "title": "Execution Value",
+            "description": "Nominal value of the execution"
+        }
 
     class Fee(FieldInfo):
-        field = dict(
-            title="Execution Fee",
-            description="Fee charged for this execution"
-        )
+        field = {
+            "title": "Execution Fee",
+            "description": "Fee charged for this execution"
+        }
 
 
 class OrderQuantity:
@@ -631,34 +715,34 @@ class OrderQuantity:
     """
 
     class Display(FieldInfo):
-        field = dict(
-            title="Display Quantity",
-            description="Display Quantity for iceberg orders visible to the book"
-        )
+        field = {
+            "title": "Display Quantity",
+            "description": "Display Quantity for iceberg orders visible to the book"
+        }
 
     class Cumulative(FieldInfo):
-        field = dict(
-            title="Cumulative Quantity",
-            description="Quantity of the order that has been filled"
-        )
+        field = {
+            "title": "Cumulative Quantity",
+            "description": "Quantity of the order that has been filled"
+        }
 
     class Leaves(FieldInfo):
-        field = dict(
-            title="Leaves Quantity",
-            description="Remaining quantity of the order that is yet to be filled"
-        )
+        field = {
+            "title": "Leaves Quantity",
+            "description": "Remaining quantity of the order that is yet to be filled"
+        }
 
     class BuyLeaves(FieldInfo):
-        field = dict(
-            title="Buy Leaves Quantity",
-            description="Remaining buy quantity of the order that is yet to be filled"
-        )
+        field = {
+            "title": "Buy Leaves Quantity",
+            "description": "Remaining buy quantity of the order that is yet to be filled"
+        }
 
     class SellLeaves(FieldInfo):
-        field = dict(
-            title="Sell Leaves Quantity",
-            description="Remaining quantity of the sell order that is yet to be filled"
-        )
+        field = {
+            "title": "Sell Leaves Quantity",
+            "description": "Remaining quantity of the sell order that is yet to be filled"
+        }
 
 
 class OrderValue:
@@ -667,40 +751,40 @@ class OrderValue:
     """
 
     class AverageTransactionPrice(FieldInfo):
-        field = dict(
-            title="Average Transaction Price",
-            description="Average price of all fills for the order"
-        )
+        field = {
+            "title": "Average Transaction Price",
+            "description": "Average price of all fills for the order"
+        }
 
     class Nominal(FieldInfo):
-        field = dict(
-            title="Order Value",
-            description="Nominal value of the order"
-        )
+        field = {
+            "title": "Order Value",
+            "description": "Nominal value of the order"
+        }
 
     class Cumulative(FieldInfo):
-        field = dict(
-            title="Cumulative Value",
-            description="Cumulative nominal value of the filled portion of the order"
-        )
+        field = {
+            "title": "Cumulative Value",
+            "description": "Cumulative nominal value of the filled portion of the order"
+        }
 
     class Leaves(FieldInfo):
-        field = dict(
-            title="Leaves Value",
-            description="Remaining nominal value of the order that is yet to be filled"
-        )
+        field = {
+            "title": "Leaves Value",
+            "description": "Remaining nominal value of the order that is yet to be filled"
+        }
 
     class BuyLeaves(FieldInfo):
-        field = dict(
-            title="Buy Leaves Value",
-            description="Remaining buy nominal value of the order that is yet to be filled"
-        )
+        field = {
+            "title": "Buy Leaves Value",
+            "description": "Remaining buy nominal value of the order that is yet to be filled"
+        }
 
     class SellLeaves(FieldInfo):
-        field = dict(
-            title="Sell Leaves Value",
-            description="Remaining nominal value of the sell order that is yet to be filled"
-        )
+        field = {
+            "title": "Sell Leaves Value",
+            "description": "Remaining nominal value of the sell order that is yet to be filled"
+        }
 
 
 class OrderBook:
@@ -709,22 +793,22 @@ class OrderBook:
     """
 
     class Depth(FieldInfo):
-        field = dict(
-            title="Orderbook Depth",
-            description="Depth of the orderbook data"
-        )
+        field = {
+            "title": "Orderbook Depth",
+            "description": "Depth of the orderbook data"
+        }
 
     class Kind(FieldInfo):
-        field = dict(
-            title="Orderbook Type",
-            description="Type of the orderbook data"
-        )
+        field = {
+            "title": "Orderbook Type",
+            "description": "Type of the orderbook data"
+        }
 
     class Sequence(FieldInfo):
-        field = dict(
-            title="Orderbook Sequence",
-            description="Sequence number of the orderbook update"
-        )
+        field = {
+            "title": "Orderbook Sequence",
+            "description": "Sequence number of the orderbook update"
+        }
 
 
 class PNL:
@@ -733,54 +817,54 @@ class PNL:
     """
 
     class Closed(FieldInfo):
-        field = dict(
-            title="Closed PnL",
-            description="Realized PnL for closed portion of the order"
-        )
+        field = {
+            "title": "Closed PnL",
+            "description": "Realized PnL for closed portion of the order"
+        }
 
     class CumulativeClosed(FieldInfo):
-        field = dict(
-            title="Cumulative Closed PnL",
-            description="Cumulative closed profit and loss"
-        )
+        field = {
+            "title": "Cumulative Closed PnL",
+            "description": "Cumulative closed profit and loss"
+        }
 
     class Realized(FieldInfo):
-        field = dict(
-            title="Realized PnL",
-            description="Realized profit and loss"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Realized PnL",
+            "description": "Realized profit and loss"
+        }
+        scale = _SCALE_VALUE
 
     class CumulativeRealized(FieldInfo):
-        field = dict(
-            title="Cumulative Realized PnL",
-            description="Cumulative realized profit and loss"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Cumulative Realized PnL",
+            "description": "Cumulative realized profit and loss"
+        }
+        scale = _SCALE_VALUE
 
     class CurrentRealized(FieldInfo):
-        field = dict(
-            title="Current Term Realized PnL",
-            description="Realized profit and loss for the current term"
-        )
+        field = {
+            "title": "Current Term Realized PnL",
+            "description": "Realized profit and loss for the current term"
+        }
 
     class Total(FieldInfo):
-        field = dict(
-            title="Total PnL",
-            description="Total profit and loss including realized and unrealized amounts."
-        )
+        field = {
+            "title": "Total PnL",
+            "description": "Total profit and loss including realized and unrealized amounts."
+        }
 
     class PositionTotal(FieldInfo):
-        field = dict(
-            title="Total Unrealized PnL",
-            description="Total unrealized profit and loss across all open positions."
-        )
+        field = {
+            "title": "Total Unrealized PnL",
+            "description": "Total unrealized profit and loss across all open positions."
+        }
 
     class Unrealized(FieldInfo):
-        field = dict(
-            title="Unrealized PnL",
-            description="Unrealized profit and loss"
-        )
+        field = {
+            "title": "Unrealized PnL",
+            "description": "Unrealized profit and loss"
+        }
 
 
 class Position:
@@ -789,60 +873,60 @@ class Position:
     """
 
     class Mode(FieldInfo):
-        field = dict(
-            title="Position Mode",
-            description="Position mode: One-way or Hedged"
-        )
-        options = ["OneWay", "Hedged"]
+        field = {
+            "title": "Position Mode",
+            "description": "Position mode: One-way or Hedged"
+        }
+        options = ("OneWay", "Hedged")
 
     class Side(FieldInfo):
-        field = dict(
-            title="Position Side",
-            description="Position side in hedge mode: Long or Short."
-        )
-        options = ["Merged", "Long", "Short"]
+        field = {
+            "title": "Position Side",
+            "description": "Position side in hedge mode: Long or Short."
+        }
+        options = ("Merged", "Long", "Short")
 
     class Size(FieldInfo):
-        field = dict(
-            title="Size",
-            description="Position size in contracts"
-        )
+        field = {
+            "title": "Size",
+            "description": "Position size in contracts"
+        }
 
     class ClosedSize(FieldInfo):
-        field = dict(
-            title="Closed Size",
-            description="Quantity of the order that has been closed"
-        )
+        field = {
+            "title": "Closed Size",
+            "description": "Quantity of the order that has been closed"
+        }
 
     class OpenTime(FieldInfo):
-        field = dict(
-            title="Open Time NS",
-            description="Timestamp in which the position was opened on the exchange in nanoseconds"
-        )
+        field = {
+            "title": "Open Time NS",
+            "description": "Timestamp in which the position was opened on the exchange in nanoseconds"
+        }
 
     class Status(FieldInfo):
-        field = dict(
-            title="Position Status",
-            description="Current status of the position"
-        )
+        field = {
+            "title": "Position Status",
+            "description": "Current status of the position"
+        }
 
     class ExecutionSequence(FieldInfo):
-        field = dict(
-            title="Execution Sequence",
-            description="Execution sequence number"
-        )
+        field = {
+            "title": "Execution Sequence",
+            "description": "Execution sequence number"
+        }
 
     class FinishedFlag(FieldInfo):
-        field = dict(
-            title="Finished",
-            description="Indicates if the order is finished (completely filled or canceled)"
-        )
+        field = {
+            "title": "Finished",
+            "description": "Indicates if the order is finished (completely filled or canceled)"
+        }
 
     class ROI(FieldInfo):
-        field = dict(
-            title="Return on Investment (ROI)",
-            description="Return on investment ratio"
-        )
+        field = {
+            "title": "Return on Investment (ROI)",
+            "description": "Return on investment ratio"
+        }
 
 
 class PositionBalance:
@@ -851,52 +935,52 @@ class PositionBalance:
     """
 
     class Equity(FieldInfo):
-        field = dict(
-            title="Total Equity",
-            description="Total equity including unrealized profit and loss."
-        )
+        field = {
+            "title": "Total Equity",
+            "description": "Total equity including unrealized profit and loss."
+        }
 
     class Used(FieldInfo):
-        field = dict(
-            title="Used Balance",
-            description="Balance used for this position"
-        )
+        field = {
+            "title": "Used Balance",
+            "description": "Balance used for this position"
+        }
 
     class Assigned(FieldInfo):
-        field = dict(
-            title="Assigned Balance",
-            description="Assigned position balance"
-        )
+        field = {
+            "title": "Assigned Balance",
+            "description": "Assigned position balance"
+        }
 
     class Current(FieldInfo):
-        field = dict(
-            title="Position Balance",
-            description="Current balance of the position"
-        )
+        field = {
+            "title": "Position Balance",
+            "description": "Current balance of the position"
+        }
 
     class Estimated(FieldInfo):
-        field = dict(
-            title="Estimated Available Balance",
-            description="Estimated available balance for trading after accounting for margin and open orders."
-        )
+        field = {
+            "title": "Estimated Available Balance",
+            "description": "Estimated available balance for trading after accounting for margin and open orders."
+        }
 
     class Fixed(FieldInfo):
-        field = dict(
-            title="Fixed Used Balance",
-            description="Fixed portion of the balance currently allocated to margin or reserved usage."
-        )
+        field = {
+            "title": "Fixed Used Balance",
+            "description": "Fixed portion of the balance currently allocated to margin or reserved usage."
+        }
 
     class Locked(FieldInfo):
-        field = dict(
-            title="Total Order Used Balance",
-            description="Total balance currently locked by open orders."
-        )
+        field = {
+            "title": "Total Order Used Balance",
+            "description": "Total balance currently locked by open orders."
+        }
 
     class Free(FieldInfo):
-        field = dict(
-            title="Total Free Balance",
-            description="Total free balance available for trading."
-        )
+        field = {
+            "title": "Total Free Balance",
+            "description": "Total free balance available for trading."
+        }
 
 
 class PositionCost:
@@ -905,28 +989,28 @@ class PositionCost:
     """
 
     class TotalPositionCost(FieldInfo):
-        field = dict(
-            title="Total Position Cost",
-            description="Total cost basis of all open positions."
-        )
+        field = {
+            "title": "Total Position Cost",
+            "description": "Total cost basis of all open positions."
+        }
 
     class BuySideCost(FieldInfo):
-        field = dict(
-            title="Buy to Cost Ratio",
-            description="Buy-side value-to-cost ratio"
-        )
+        field = {
+            "title": "Buy to Cost Ratio",
+            "description": "Buy-side value-to-cost ratio"
+        }
 
     class SellSideCost(FieldInfo):
-        field = dict(
-            title="Sell to Cost Ratio",
-            description="Sell-side value-to-cost ratio"
-        )
+        field = {
+            "title": "Sell to Cost Ratio",
+            "description": "Sell-side value-to-cost ratio"
+        }
 
     class CostBasis(FieldInfo):
-        field = dict(
-            title="Cost Basis",
-            description="Cost basis of the position"
-        )
+        field = {
+            "title": "Cost Basis",
+            "description": "Cost basis of the position"
+        }
 
 
 class PositionFee:
@@ -935,41 +1019,41 @@ class PositionFee:
     """
 
     class CumulativeFunding(FieldInfo):
-        field = dict(
-            title="Cumulative Funding Fee",
-            description="Cumulative funding fees paid"
-        )
+        field = {
+            "title": "Cumulative Funding Fee",
+            "description": "Cumulative funding fees paid"
+        }
 
     class CumulativeTransaction(FieldInfo):
-        field = dict(
-            title="Cumulative Transaction Fee",
-            description="Cumulative transaction fees paid"
-        )
+        field = {
+            "title": "Cumulative Transaction Fee",
+            "description": "Cumulative transaction fees paid"
+        }
 
     class Current(FieldInfo):
-        field = dict(
-            title="Position Fee",
-            description="Fee associated with the position"
-        )
+        field = {
+            "title": "Position Fee",
+            "description": "Fee associated with the position"
+        }
 
     class Exchange(FieldInfo):
-        field = dict(
-            title="Exchange Fee",
-            description="Fee charged by the exchange for this execution"
-        )
-        scale = PhemexScale.ratio()
+        field = {
+            "title": "Exchange Fee",
+            "description": "Fee charged by the exchange for this execution"
+        }
+        scale = _SCALE_RATIO
 
     class Maker(FieldInfo):
-        field = dict(
-            title="Maker Fee",
-            description="Maker fee rate for the contract"
-        )
+        field = {
+            "title": "Maker Fee",
+            "description": "Maker fee rate for the contract"
+        }
 
     class Taker(FieldInfo):
-        field = dict(
-            title="Taker Fee",
-            description="Taker fee rate for the contract"
-        )
+        field = {
+            "title": "Taker Fee",
+            "description": "Taker fee rate for the contract"
+        }
 
 
 class PositionLeverage:
@@ -978,34 +1062,34 @@ class PositionLeverage:
     """
 
     class Leverage(FieldInfo):
-        field = dict(
-            title="One-Way Leverage",
-            description="Leverage ratio applied to this position (OneWay mode only)"
-        )
+        field = {
+            "title": "One-Way Leverage",
+            "description": "Leverage ratio applied to this position (OneWay mode only)"
+        }
 
     class LongLeverage(FieldInfo):
-        field = dict(
-            title="Long Leverage",
-            description="Leverage ratio for long positions (Hedged mode only)"
-        )
+        field = {
+            "title": "Long Leverage",
+            "description": "Leverage ratio for long positions (Hedged mode only)"
+        }
 
     class ShortLeverage(FieldInfo):
-        field = dict(
-            title="Short Leverage",
-            description="Leverage ratio for short positions (Hedged mode only)"
-        )
+        field = {
+            "title": "Short Leverage",
+            "description": "Leverage ratio for short positions (Hedged mode only)"
+        }
 
     class Ratio(FieldInfo):
-        field = dict(
-            title="Leverage Ratio",
-            description="Leverage ratio applied to this position"
-        )
+        field = {
+            "title": "Leverage Ratio",
+            "description": "Leverage ratio applied to this position"
+        }
 
     class Current(FieldInfo):
-        field = dict(
-            title="Position Leverage",
-            description="Leverage ratio applied to this position"
-        )
+        field = {
+            "title": "Position Leverage",
+            "description": "Leverage ratio applied to this position"
+        }
 
 
 class PositionLoss:
@@ -1014,23 +1098,23 @@ class PositionLoss:
     """
 
     class Estimated(FieldInfo):
-        field = dict(
-            title="Estimated Order Loss",
-            description="Estimated order loss"
-        )
+        field = {
+            "title": "Estimated Order Loss",
+            "description": "Estimated order loss"
+        }
 
     class Open(FieldInfo):
-        field = dict(
-            title="Total Order Open Loss",
-            description="Total unrealized loss from open orders."
-        )
+        field = {
+            "title": "Total Order Open Loss",
+            "description": "Total unrealized loss from open orders."
+        }
 
     class Unrealized(FieldInfo):
-        field = dict(
-            title="Unrealized Position Loss",
-            description="Unrealized position loss (scaled)"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Unrealized Position Loss",
+            "description": "Unrealized position loss (scaled)"
+        }
+        scale = _SCALE_VALUE
 
 
 class PositionMargin:
@@ -1039,22 +1123,22 @@ class PositionMargin:
     """
 
     class Allocated(FieldInfo):
-        field = dict(
-            title="Margin",
-            description="Margin allocated to this position"
-        )
+        field = {
+            "title": "Margin",
+            "description": "Margin allocated to this position"
+        }
 
     class Ratio(FieldInfo):
-        field = dict(
-            title="Margin Ratio",
-            description="Current margin ratio representing used margin versus total equity."
-        )
+        field = {
+            "title": "Margin Ratio",
+            "description": "Current margin ratio representing used margin versus total equity."
+        }
 
     class Cross(FieldInfo):
-        field = dict(
-            title="Cross Margin",
-            description="Cross margin mode status"
-        )
+        field = {
+            "title": "Cross Margin",
+            "description": "Cross margin mode status"
+        }
 
 
 class PositionPrice:
@@ -1063,34 +1147,34 @@ class PositionPrice:
     """
 
     class Current(FieldInfo):
-        field = dict(
-            title="Position Price",
-            description="Average entry price for the position"
-        )
+        field = {
+            "title": "Position Price",
+            "description": "Average entry price for the position"
+        }
 
     class Entry(FieldInfo):
-        field = dict(
-            title="Avg Entry Price",
-            description="Average entry price for the position"
-        )
+        field = {
+            "title": "Avg Entry Price",
+            "description": "Average entry price for the position"
+        }
 
     class Open(FieldInfo):
-        field = dict(
-            title="Open Price",
-            description="Opening price for the trade"
-        )
+        field = {
+            "title": "Open Price",
+            "description": "Opening price for the trade"
+        }
 
     class Bankrupt(FieldInfo):
-        field = dict(
-            title="Bankrupt Price",
-            description="Estimated bankruptcy price"
-        )
+        field = {
+            "title": "Bankrupt Price",
+            "description": "Estimated bankruptcy price"
+        }
 
     class Liquidation(FieldInfo):
-        field = dict(
-            title="Liquidation Price",
-            description="Estimated liquidation price"
-        )
+        field = {
+            "title": "Liquidation Price",
+            "description": "Estimated liquidation price"
+        }
 
 
 class PositionRisk:
@@ -1099,34 +1183,34 @@ class PositionRisk:
     """
 
     class TotalPositionMM(FieldInfo):
-        field = dict(
-            title="Total Maintenance Margin",
-            description="Total maintenance margin required for all open positions."
-        )
+        field = {
+            "title": "Total Maintenance Margin",
+            "description": "Total maintenance margin required for all open positions."
+        }
 
     class RiskLimit(FieldInfo):
-        field = dict(
-            title="Risk Limit",
-            description="Risk limit for this position"
-        )
+        field = {
+            "title": "Risk Limit",
+            "description": "Risk limit for this position"
+        }
 
     class RiskMode(FieldInfo):
-        field = dict(
-            title="Risk Mode",
-            description="Account risk management mode (e.g., CrossAsset or Isolated)."
-        )
+        field = {
+            "title": "Risk Mode",
+            "description": "Account risk management mode (e.g., CrossAsset or Isolated)."
+        }
 
     class DeleveragePercentile(FieldInfo):
-        field = dict(
-            title="Deleverage Percentile",
-            description="ADL (auto-deleveraging) priority percentile"
-        )
+        field = {
+            "title": "Deleverage Percentile",
+            "description": "ADL (auto-deleveraging) priority percentile"
+        }
 
     class BankruptCommission(FieldInfo):
-        field = dict(
-            title="Bankrupt Commission",
-            description="Commission lost at bankruptcy"
-        )
+        field = {
+            "title": "Bankrupt Commission",
+            "description": "Commission lost at bankruptcy"
+        }
 
 
 class PositionTerm:
@@ -1135,22 +1219,22 @@ class PositionTerm:
     """
 
     class LastFundingTime(FieldInfo):
-        field = dict(
-            title="Last Funding Time",
-            description="Last funding timestamp (nanoseconds)"
-        )
+        field = {
+            "title": "Last Funding Time",
+            "description": "Last funding timestamp (nanoseconds)"
+        }
 
     class LastTermEndTime(FieldInfo):
-        field = dict(
-            title="Last Term End Time",
-            description="End time of the last settlement term (nanoseconds)"
-        )
+        field = {
+            "title": "Last Term End Time",
+            "description": "End time of the last settlement term (nanoseconds)"
+        }
 
     class Index(FieldInfo):
-        field = dict(
-            title="Settlement Term Index",
-            description="Current settlement term index"
-        )
+        field = {
+            "title": "Settlement Term Index",
+            "description": "Current settlement term index"
+        }
 
 
 class PositionValue:
@@ -1159,23 +1243,23 @@ class PositionValue:
     """
 
     class Nominal(FieldInfo):
-        field = dict(
-            title="Value",
-            description="Nominal value of the position"
-        )
+        field = {
+            "title": "Value",
+            "description": "Nominal value of the position"
+        }
 
     class Mark(FieldInfo):
-        field = dict(
-            title="Mark Value",
-            description="Mark value (scaled)"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Mark Value",
+            "description": "Mark value (scaled)"
+        }
+        scale = _SCALE_VALUE
 
     class CumulativeEntry(FieldInfo):
-        field = dict(
-            title="Cumulative Entry Value",
-            description="Cumulative entry value of the position"
-        )
+        field = {
+            "title": "Cumulative Entry Value",
+            "description": "Cumulative entry value of the position"
+        }
 
 
 class Price:
@@ -1184,76 +1268,76 @@ class Price:
     """
 
     class Ask(FieldInfo):
-        field = dict(
-            title="Ask Price",
-            description="Current best ask price."
-        )
+        field = {
+            "title": "Ask Price",
+            "description": "Current best ask price."
+        }
 
     class Bid(FieldInfo):
-        field = dict(
-            title="Bid Price",
-            description="Current best bid price"
-        )
+        field = {
+            "title": "Bid Price",
+            "description": "Current best bid price"
+        }
 
     class Close(FieldInfo):
-        field = dict(
-            title="Close Price",
-            description="Average price for the closed portion of the order"
-        )
+        field = {
+            "title": "Close Price",
+            "description": "Average price for the closed portion of the order"
+        }
 
     class High(FieldInfo):
-        field = dict(
-            title="High Price",
-            description="High price in the last 24h."
-        )
+        field = {
+            "title": "High Price",
+            "description": "High price in the last 24h."
+        }
 
     class Index(FieldInfo):
-        field = dict(
-            title="Index Price",
-            description="Underlying index price"
-        )
+        field = {
+            "title": "Index Price",
+            "description": "Underlying index price"
+        }
 
     class Last(FieldInfo):
-        field = dict(
-            title="Last Price",
-            description="Last traded price"
-        )
+        field = {
+            "title": "Last Price",
+            "description": "Last traded price"
+        }
 
     class Low(FieldInfo):
-        field = dict(
-            title="Low Price",
-            description="Low price in the last 24h"
-        )
+        field = {
+            "title": "Low Price",
+            "description": "Low price in the last 24h"
+        }
 
     class Mark(FieldInfo):
-        field = dict(
-            title="Mark Price",
-            description="Mark price"
-        )
+        field = {
+            "title": "Mark Price",
+            "description": "Mark price"
+        }
 
     class Open(FieldInfo):
-        field = dict(
-            title="Open Price",
-            description="Opening price in the last 24h"
-        )
+        field = {
+            "title": "Open Price",
+            "description": "Opening price in the last 24h"
+        }
 
     class OpenInterest(FieldInfo):
-        field = dict(
-            title="Open Interest",
-            description="Open interest"
-        )
+        field = {
+            "title": "Open Interest",
+            "description": "Open interest"
+        }
 
     class Turnover(FieldInfo):
-        field = dict(
-            title="Turnover",
-            description="24h notional turnover"
-        )
+        field = {
+            "title": "Turnover",
+            "description": "24h notional turnover"
+        }
 
     class Volume(FieldInfo):
-        field = dict(
-            title="Volume",
-            description="24h trading volume in contracts"
-        )
+        field = {
+            "title": "Volume",
+            "description": "24h trading volume in contracts"
+        }
 
 
 class Product:
@@ -1262,76 +1346,76 @@ class Product:
     """
 
     class ProductType(FieldInfo):
-        field = dict(
-            title="Product Type",
-            description="Type of product (e.g., Perpetual, Futures)"
-        )
+        field = {
+            "title": "Product Type",
+            "description": "Type of product (e.g., Perpetual, Futures)"
+        }
 
     class ProductSubType(FieldInfo):
-        field = dict(
-            title="Perpetual Product Subtype",
-            description="Subtype of the perpetual contract (e.g., Normal, Linear, Inverse)"
-        )
+        field = {
+            "title": "Perpetual Product Subtype",
+            "description": "Subtype of the perpetual contract (e.g., Normal, Linear, Inverse)"
+        }
 
     class Code(FieldInfo):
-        field = dict(
-            title="Product Code",
-            description="Internal numeric code identifying the product"
-        )
+        field = {
+            "title": "Product Code",
+            "description": "Internal numeric code identifying the product"
+        }
 
     class Name(FieldInfo):
-        field = dict(
-            title="Product Name",
-            description="Full name of the product/currency (e.g., Bitcoin)"
-        )
+        field = {
+            "title": "Product Name",
+            "description": "Full name of the product/currency (e.g., Bitcoin)"
+        }
 
     class Description(FieldInfo):
-        field = dict(
-            title="Instrument Description",
-            description="Detailed description of the contract, including funding and settlement rules"
-        )
+        field = {
+            "title": "Instrument Description",
+            "description": "Detailed description of the contract, including funding and settlement rules"
+        }
 
     class Status(FieldInfo):
-        field = dict(
-            title="Listing Status",
-            description="Listing status of the currency (e.g., Listed, Delisted)"
-        )
+        field = {
+            "title": "Listing Status",
+            "description": "Listing status of the currency (e.g., Listed, Delisted)"
+        }
 
     class ListTime(FieldInfo):
-        field = dict(
-            title="Listing Time",
-            description="Timestamp (ms) when the contract was listed on the exchange"
-        )
+        field = {
+            "title": "Listing Time",
+            "description": "Timestamp (ms) when the contract was listed on the exchange"
+        }
 
     class AssetsDisplay(FieldInfo):
-        field = dict(
-            title="In Assets Display",
-            description="Flag indicating whether this currency is displayed in the assets list (1 = visible)"
-        )
+        field = {
+            "title": "In Assets Display",
+            "description": "Flag indicating whether this currency is displayed in the assets list (1 = visible)"
+        }
 
     class NeedAddressTag(FieldInfo):
-        field = dict(
-            title="Need Address Tag",
-            description="Flag indicating whether this currency requires an address tag or memo when depositing or withdrawing"
-        )
+        field = {
+            "title": "Need Address Tag",
+            "description": "Flag indicating whether this currency requires an address tag or memo when depositing or withdrawing"
+        }
 
     class MaxOI(FieldInfo):
-        field = dict(
-            title="Maximum Open Interest",
-            description="Maximum allowable open interest for this contract (-1 = unlimited)"
-        )
+        field = {
+            "title": "Maximum Open Interest",
+            "description": "Maximum allowable open interest for this contract (-1 = unlimited)"
+        }
 
     class PilotTrading(FieldInfo):
-        field = dict(
-            title="Is Pilot Trading",
-            description="Flag indicating whether the product is in pilot trading mode (1 = yes, 0 = no)"
-        )
+        field = {
+            "title": "Is Pilot Trading",
+            "description": "Flag indicating whether the product is in pilot trading mode (1 = yes, 0 = no)"
+        }
 
     class Checksum(FieldInfo):
-        field = dict(
-            title="Checksum",
-            description="Checksum value for data integrity verification"
-        )
+        field = {
+            "title": "Checksum",
+            "description": "Checksum value for data integrity verification"
+        }
 
 
 class ProductLimit:
@@ -1340,108 +1424,108 @@ class ProductLimit:
     """
 
     class MinValue(FieldInfo):
-        field = dict(
-            title="Minimum Value",
-            description="Minimum allowable value for transfers or balances, expressed in exchange value units"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Minimum Value",
+            "description": "Minimum allowable value for transfers or balances, expressed in exchange value units"
+        }
+        scale = _SCALE_VALUE
 
     class MaxValue(FieldInfo):
-        field = dict(
-            title="Maximum Value",
-            description="Maximum allowable value for transfers or balances, expressed in exchange value units"
-        )
+        field = {
+            "title": "Maximum Value",
+            "description": "Maximum allowable value for transfers or balances, expressed in exchange value units"
+        }
 
     class MinPrice(FieldInfo):
-        field = dict(
-            title="Minimum Price",
-            description="Minimum allowed price for orders, expressed in quote price units"
-        )
-        scale = PhemexScale.price()
+        field = {
+            "title": "Minimum Price",
+            "description": "Minimum allowed price for orders, expressed in quote price units"
+        }
+        scale = _SCALE_PRICE
 
     class MaxPrice(FieldInfo):
-        field = dict(
-            title="Maximum Price",
-            description="Maximum allowed price for orders, expressed in quote price units"
-        )
-        scale = PhemexScale.price()
+        field = {
+            "title": "Maximum Price",
+            "description": "Maximum allowed price for orders, expressed in quote price units"
+        }
+        scale = _SCALE_PRICE
 
     class ContractSize(FieldInfo):
-        field = dict(
-            title="Contract Size",
-            description="Nominal value of one contract in quote currency units"
-        )
+        field = {
+            "title": "Contract Size",
+            "description": "Nominal value of one contract in quote currency units"
+        }
 
     class LotSize(FieldInfo):
-        field = dict(
-            title="Lot Size",
-            description="Minimum tradable quantity increment for orders"
-        )
+        field = {
+            "title": "Lot Size",
+            "description": "Minimum tradable quantity increment for orders"
+        }
 
     class QuantityStepSize(FieldInfo):
-        field = dict(
-            title="Quantity Step Size",
-            description="Minimum increment for order quantities"
-        )
+        field = {
+            "title": "Quantity Step Size",
+            "description": "Minimum increment for order quantities"
+        }
 
     class MinOrderValue(FieldInfo):
-        field = dict(
-            title="Minimum Order Value",
-            description="Minimum order value in real terms"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Minimum Order Value",
+            "description": "Minimum order value in real terms"
+        }
+        scale = _SCALE_VALUE
 
     class MaxOrderValue(FieldInfo):
-        field = dict(
-            title="Maximum Order Value",
-            description="Maximum order value for the product"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Maximum Order Value",
+            "description": "Maximum order value for the product"
+        }
+        scale = _SCALE_VALUE
 
     class MaxOrderQuantity(FieldInfo):
-        field = dict(
-            title="Maximum Order Quantity",
-            description="Maximum order quantity allowed, expressed in requested quantity units"
-        )
+        field = {
+            "title": "Maximum Order Quantity",
+            "description": "Maximum order quantity allowed, expressed in requested quantity units"
+        }
 
     class MaxBaseOrderSize(FieldInfo):
-        field = dict(
-            title="Maximum Base Order Size",
-            description="Maximum order size in base currency units (scaled)"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Maximum Base Order Size",
+            "description": "Maximum order size in base currency units (scaled)"
+        }
+        scale = _SCALE_VALUE
 
     class TipOrderQuantity(FieldInfo):
-        field = dict(
-            title="Tip Order Quantity",
-            description="Recommended tip quantity size in requested quantity units"
-        )
+        field = {
+            "title": "Tip Order Quantity",
+            "description": "Recommended tip quantity size in requested quantity units"
+        }
 
     class BuyUpperLimit(FieldInfo):
-        field = dict(
-            title="Buy Price Upper Limit Percent",
-            description="Maximum allowable buy price as a percentage above the reference price"
-        )
+        field = {
+            "title": "Buy Price Upper Limit Percent",
+            "description": "Maximum allowable buy price as a percentage above the reference price"
+        }
 
     class SellLowerLimit(FieldInfo):
-        field = dict(
-            title="Sell Lower Limit Percentage",
-            description="Percentage below the reference price that defines the lower limit for sell orders"
-        )
+        field = {
+            "title": "Sell Lower Limit Percentage",
+            "description": "Percentage below the reference price that defines the lower limit for sell orders"
+        }
 
     class DefaultMakerFee(FieldInfo):
-        field = dict(
-            title="Default Maker Fee",
-            description="Default maker fee rate"
-        )
-        scale = PhemexScale.ratio()
+        field = {
+            "title": "Default Maker Fee",
+            "description": "Default maker fee rate"
+        }
+        scale = _SCALE_RATIO
 
     class DefaultTakerFee(FieldInfo):
-        field = dict(
-            title="Default Taker Fee",
-            description="Default taker fee rate"
-        )
-        scale = PhemexScale.ratio()
+        field = {
+            "title": "Default Taker Fee",
+            "description": "Default taker fee rate"
+        }
+        scale = _SCALE_RATIO
 
 
 class ProductPrecision:
@@ -1450,34 +1534,34 @@ class ProductPrecision:
     """
 
     class Asset(FieldInfo):
-        field = dict(
-            title="Assets Precision",
-            description="Number of decimal places supported for this asset's display and calculation precision"
-        )
+        field = {
+            "title": "Assets Precision",
+            "description": "Number of decimal places supported for this asset's display and calculation precision"
+        }
 
     class Price(FieldInfo):
-        field = dict(
-            title="Price Precision",
-            description="Number of decimal places shown for displayed price values"
-        )
+        field = {
+            "title": "Price Precision",
+            "description": "Number of decimal places shown for displayed price values"
+        }
 
     class Quantity(FieldInfo):
-        field = dict(
-            title="Quantity Precision",
-            description="Number of decimal places supported for quantity values"
-        )
+        field = {
+            "title": "Quantity Precision",
+            "description": "Number of decimal places supported for quantity values"
+        }
 
     class BaseQuantity(FieldInfo):
-        field = dict(
-            title="Base Quantity Precision",
-            description="Number of decimal places supported for quantity values"
-        )
+        field = {
+            "title": "Base Quantity Precision",
+            "description": "Number of decimal places supported for quantity values"
+        }
 
     class QuoteQuantity(FieldInfo):
-        field = dict(
-            title="Quote Quantity Precision",
-            description="Number of decimal places supported for quantity values"
-        )
+        field = {
+            "title": "Quote Quantity Precision",
+            "description": "Number of decimal places supported for quantity values"
+        }
 
 
 class ProductRisk:
@@ -1486,48 +1570,48 @@ class ProductRisk:
     """
 
     class IndexID(FieldInfo):
-        field = dict(
-            title="Index ID",
-            description="Identifier for the leverage margin group"
-        )
+        field = {
+            "title": "Index ID",
+            "description": "Identifier for the leverage margin group"
+        }
 
     class NotionalValue(FieldInfo):
-        field = dict(
-            title="Notional Value",
-            description="Notional value of the position"
-        )
+        field = {
+            "title": "Notional Value",
+            "description": "Notional value of the position"
+        }
 
     class RiskSteps(FieldInfo):
-        field = dict(
-            title="Risk Steps",
-            description="Array of risk limit steps in exchange value units"
-        )
+        field = {
+            "title": "Risk Steps",
+            "description": "Array of risk limit steps in exchange value units"
+        }
 
     class MaxRiskLimit(FieldInfo):
-        field = dict(
-            title="Maximum Risk Limit",
-            description="Maximum risk limit tier for the product"
-        )
+        field = {
+            "title": "Maximum Risk Limit",
+            "description": "Maximum risk limit tier for the product"
+        }
 
     class InitialMargin(FieldInfo):
-        field = dict(
-            title="Initial Margin Ratio",
-            description="Initial margin requirement ratio"
-        )
-        scale = PhemexScale.ratio()
+        field = {
+            "title": "Initial Margin Ratio",
+            "description": "Initial margin requirement ratio"
+        }
+        scale = _SCALE_RATIO
 
     class MaintenanceMargin(FieldInfo):
-        field = dict(
-            title="Maintenance Margin Ratio",
-            description="Maintenance margin requirement ratio for this position"
-        )
-        scale = PhemexScale.ratio()
+        field = {
+            "title": "Maintenance Margin Ratio",
+            "description": "Maintenance margin requirement ratio for this position"
+        }
+        scale = _SCALE_RATIO
 
     class MaintenanceAmount(FieldInfo):
-        field = dict(
-            title="Maintenance Amount",
-            description="Maintenance amount required for the position"
-        )
+        field = {
+            "title": "Maintenance Amount",
+            "description": "Maintenance amount required for the position"
+        }
 
 
 class ProductLeverage:
@@ -1536,34 +1620,34 @@ class ProductLeverage:
     """
 
     class Default(FieldInfo):
-        field = dict(
-            title="Default Leverage",
-            description="Default leverage value applied when opening new positions"
-        )
+        field = {
+            "title": "Default Leverage",
+            "description": "Default leverage value applied when opening new positions"
+        }
 
     class Max(FieldInfo):
-        field = dict(
-            title="Maximum Leverage",
-            description="Maximum leverage allowed for the contract"
-        )
+        field = {
+            "title": "Maximum Leverage",
+            "description": "Maximum leverage allowed for the contract"
+        }
 
     class MaxMargin(FieldInfo):
-        field = dict(
-            title="Leverage Margin",
-            description="Margin requirement factor associated with maximum leverage"
-        )
+        field = {
+            "title": "Leverage Margin",
+            "description": "Margin requirement factor associated with maximum leverage"
+        }
 
     class MaxOpen(FieldInfo):
-        field = dict(
-            title="Maximum Open Position Leverage",
-            description="Maximum leverage allowed for open positions on this instrument"
-        )
+        field = {
+            "title": "Maximum Open Position Leverage",
+            "description": "Maximum leverage allowed for open positions on this instrument"
+        }
 
     class Options(FieldInfo):
-        field = dict(
-            title="Leverage Options",
-            description="List of available leverage options for the contract"
-        )
+        field = {
+            "title": "Leverage Options",
+            "description": "List of available leverage options for the contract"
+        }
 
 
 class ProductScale:
@@ -1572,22 +1656,22 @@ class ProductScale:
     """
 
     class Price(FieldInfo):
-        field = dict(
-            title="Price Scale",
-            description="Scaling factor for converting between display and exchange price units"
-        )
+        field = {
+            "title": "Price Scale",
+            "description": "Scaling factor for converting between display and exchange price units"
+        }
 
     class Ratio(FieldInfo):
-        field = dict(
-            title="Ratio Scale",
-            description="Scaling factor for ratio-based quantities such as funding rates"
-        )
+        field = {
+            "title": "Ratio Scale",
+            "description": "Scaling factor for ratio-based quantities such as funding rates"
+        }
 
     class Value(FieldInfo):
-        field = dict(
-            title="Value Scale",
-            description="Number of decimal places used for the currency's value scale on the exchange"
-        )
+        field = {
+            "title": "Value Scale",
+            "description": "Number of decimal places used for the currency's value scale on the exchange"
+        }
 
 
 class ProductTick:
@@ -1596,24 +1680,24 @@ class ProductTick:
     """
 
     class Size(FieldInfo):
-        field = dict(
-            title="Tick Size",
-            description="Minimum price increment allowed between order prices"
-        )
+        field = {
+            "title": "Tick Size",
+            "description": "Minimum price increment allowed between order prices"
+        }
 
     class BaseSize(FieldInfo):
-        field = dict(
-            title="Base Tick Size",
-            description="Standard price increment for orders in raw format (scaled by 1e8)"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Base Tick Size",
+            "description": "Standard price increment for orders in raw format (scaled by 1e8)"
+        }
+        scale = _SCALE_VALUE
 
     class QuoteSize(FieldInfo):
-        field = dict(
-            title="Quote Tick Size",
-            description="Standard price increment for orders in raw format (scaled by 1e8)"
-        )
-        scale = PhemexScale.value()
+        field = {
+            "title": "Quote Tick Size",
+            "description": "Standard price increment for orders in raw format (scaled by 1e8)"
+        }
+        scale = _SCALE_VALUE
 
 
 class Request:
@@ -1622,77 +1706,77 @@ class Request:
     """
 
     class StartTime(FieldInfo):
-        field = dict(
-            title="Start Time",
-            description="Timestamp (ms) when the contract becomes active"
-        )
+        field = {
+            "title": "Start Time",
+            "description": "Timestamp (ms) when the contract becomes active"
+        }
 
     class EndTime(FieldInfo):
-        field = dict(
-            title="End Time",
-            description="End timestamp (ms) for the contract's validity period"
-        )
+        field = {
+            "title": "End Time",
+            "description": "End timestamp (ms) for the contract's validity period"
+        }
 
     class Limit(FieldInfo):
-        field = dict(
-            title="Result Limit",
-            description="Maximum number of results to return"
-        )
+        field = {
+            "title": "Result Limit",
+            "description": "Maximum number of results to return"
+        }
 
     class Order(FieldInfo):
-        field = dict(
-            title="Order By",
-            description="Order direction, e.g., Asc or Desc"
-        )
-        options = ["asc", "desc"]
+        field = {
+            "title": "Order By",
+            "description": "Order direction, e.g., Asc or Desc"
+        }
+        options = ("asc", "desc")
 
     class OrderBy(FieldInfo):
-        field = dict(
-            title="Order By Column",
-            description="Column to order the results by"
-        )
+        field = {
+            "title": "Order By Column",
+            "description": "Column to order the results by"
+        }
 
     class Offset(FieldInfo):
-        field = dict(
-            title="Result Offset",
-            description="Offset for paginated results"
-        )
+        field = {
+            "title": "Result Offset",
+            "description": "Offset for paginated results"
+        }
 
     class PageNumber(FieldInfo):
-        field = dict(
-            title="Page Number",
-            description="Page number for paginated results"
-        )
+        field = {
+            "title": "Page Number",
+            "description": "Page number for paginated results"
+        }
 
     class PageSize(FieldInfo):
-        field = dict(
-            title="Page Size",
-            description="Number of items per page for paginated results"
-        )
+        field = {
+            "title": "Page Size",
+            "description": "Number of items per page for paginated results"
+        }
 
     class IncludeCount(FieldInfo):
-        field = dict(
-            title="Result Count",
-            description="Whether to include the total count of results in the response"
-        )
+        field = {
+            "title": "Result Count",
+            "description": "Whether to include the total count of results in the response"
+        }
 
     class Untriggered(FieldInfo):
-        field = dict(
-            title="Untriggered Only",
-            description="Flag to filter and return only untriggered conditional orders"
-        )
+        field = {
+            "title": "Untriggered Only",
+            "description": "Flag to filter and return only untriggered conditional orders"
+        }
 
     class Resolution(FieldInfo):
-        field = dict(
-            title="Resolution",
-            description="Time resolution for the data in seconds"
-        )
+        field = {
+            "title": "Resolution",
+            "description": "Time resolution for the data in seconds"
+        }
 
     class Text(FieldInfo):
-        field = dict(
-            title="Optional Text",
-            description="Optional annotation or free text for the order."
-        )
+        field = {
+            "title": "Optional Text",
+            "description": "Optional annotation or free text for the order."
+        }
 
 
 class Symbol(FieldInfo):
@@ -1700,52 +1784,52 @@ class Symbol(FieldInfo):
     Fields relating to trading symbol information.
     For standard symbol, use this class directly as Symbol.
     """
-    field = dict(
-        title="Symbol",
-        description="Trading symbol, e.g. BTCUSDT"
-    )
+    field = {
+        "title": "Symbol",
+        "description": "Trading symbol, e.g. BTCUSDT"
+    }
 
     class Display(FieldInfo):
-        field = dict(
-            title="Display Symbol",
-            description="Display-friendly representation of the trading pair (e.g., BTC / USD)"
-        )
+        field = {
+            "title": "Display Symbol",
+            "description": "Display-friendly representation of the trading pair (e.g., BTC / USD)"
+        }
 
     class FundingRate(FieldInfo):
-        field = dict(
-            title="Funding Rate Symbol",
-            description="Symbol for the funding rate index"
-        )
+        field = {
+            "title": "Funding Rate Symbol",
+            "description": "Symbol for the funding rate index"
+        }
 
     class FundingRateShort(FieldInfo):
-        field = dict(
-            title="Funding Rate 8h Symbol",
-            description="Symbol for the 8-hour funding rate index"
-        )
+        field = {
+            "title": "Funding Rate 8h Symbol",
+            "description": "Symbol for the 8-hour funding rate index"
+        }
 
     class Index(FieldInfo):
-        field = dict(
-            title="Index Symbol",
-            description="Symbol representing the index price source for the contract"
-        )
+        field = {
+            "title": "Index Symbol",
+            "description": "Symbol representing the index price source for the contract"
+        }
 
     class Major(FieldInfo):
-        field = dict(
-            title="Major Symbol",
-            description="Boolean flag indicating if this is a major trading pair"
-        )
+        field = {
+            "title": "Major Symbol",
+            "description": "Boolean flag indicating if this is a major trading pair"
+        }
 
     class Mark(FieldInfo):
-        field = dict(
-            title="Mark Symbol",
-            description="Symbol representing the mark price index"
-        )
+        field = {
+            "title": "Mark Symbol",
+            "description": "Symbol representing the mark price index"
+        }
 
     class Underlying(FieldInfo):
-        field = dict(
-            title="Contract Underlying Assets",
-            description="Underlying assets of the contract (e.g., USD for BTCUSD)"
-        )
+        field = {
+            "title": "Contract Underlying Assets",
+            "description": "Underlying assets of the contract (e.g., USD for BTCUSD)"
+        }
 
 
 class Time:
@@ -1756,53 +1840,53 @@ class Time:
     # MILLISECONDS
 
     class Timestamp(FieldInfo):
-        field = dict(
-            title="Timestamp",
-            description="Snapshot timestamp in milliseconds"
-        )
+        field = {
+            "title": "Timestamp",
+            "description": "Snapshot timestamp in milliseconds"
+        }
 
     class CreatedAt(FieldInfo):
-        field = dict(
-            title="Created At Timestamp",
-            description="Timestamp in which the order was created on the exchange in milliseconds"
-        )
+        field = {
+            "title": "Created At Timestamp",
+            "description": "Timestamp in which the order was created on the exchange in milliseconds"
+        }
 
     class UpdatedAt(FieldInfo):
-        field = dict(
-            title="Updated At",
-            description="Timestamp (ms) of the last update to the order or position"
-        )
+        field = {
+            "title": "Updated At",
+            "description": "Timestamp (ms) of the last update to the order or position"
+        }
 
     class Data(FieldInfo):
-        field = dict(
-            title="Data Timestamp",
-            description="Timestamp (ms) when the data was generated"
-        )
+        field = {
+            "title": "Data Timestamp",
+            "description": "Timestamp (ms) when the data was generated"
+        }
 
     class Match(FieldInfo):
-        field = dict(
-            title="Match Timestamp",
-            description="Timestamp for validating order book matching"
-        )
+        field = {
+            "title": "Match Timestamp",
+            "description": "Timestamp for validating order book matching"
+        }
 
     # NANOSECONDS
 
     class Action(FieldInfo):
-        field = dict(
-            title="Action Time",
-            description="Timestamp in which the order was registered on the exchange in nanoseconds"
-        )
+        field = {
+            "title": "Action Time",
+            "description": "Timestamp in which the order was registered on the exchange in nanoseconds"
+        }
 
     class Transaction(FieldInfo):
-        field = dict(
-            title="Transaction Time",
-            description="Timestamp in which the order was fulfilled on the exchange in nanoseconds"
-        )
+        field = {
+            "title": "Transaction Time",
+            "description": "Timestamp in which the order was fulfilled on the exchange in nanoseconds"
+        }
 
     class LastUpdated(FieldInfo):
-        field = dict(
-            title="Updated Time NS",
-            description="Timestamp in which the order was last updated on the exchange in nanoseconds"
-        )
+        field = {
+            "title": "Updated Time NS",
+            "description": "Timestamp in which the order was last updated on the exchange in nanoseconds"
+        }
 
 
@@ -0,0 +1,28 @@
+"""
+JSON helpers for the transport layer. Uses orjson when installed (pip install phemex-py[fast])
+and falls back to the standard library otherwise.
+"""
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the 'fast' extra is not installed
+    orjson = None
+
+# The backends only agree on integers within 64 bits ([-2**63, 2**64 - 1]). Beyond that, orjson's
+# dumps raises TypeError and its loads returns a float, while the stdlib keeps them exact. Phemex
+# scaled values stay well inside this range, so callers should not rely on either behaviour.
+
+import json
+
+
+def loads(data: bytes | str):
+    """Parse a JSON document from raw response bytes (or str)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize to compact JSON (no whitespace between separators)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
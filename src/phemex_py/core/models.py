@@ -1,6 +1,8 @@
+from collections.abc import Iterator
 from decimal import Decimal
-from functools import reduce
+from functools import lru_cache
 import logging
+import sys
 from typing import Any, ClassVar, Self, TypeAlias, Literal
 
 from pydantic import (
@@ -25,10 +27,12 @@ logger = logging.getLogger(__name__)
 
 
 def options(*allowed: str | None):
+    allowed_set = frozenset(allowed)
+
     def _validator(v: str | None):
         if isinstance(v, str) and v.lower() == "none":
             v = None
-        if v not in allowed:
+        if v not in allowed_set:
             raise ValueError(f"Must be one of {allowed}")
         return v
 
@@ -48,34 +52,50 @@ https://phemex-docs.github.io/#price-ratio-value-scales
 
 
 class PhemexScale:
-    """Marker for fields that scale dynamically from PRODUCTS."""
+    """
+    Marker for fields that scale dynamically from PRODUCTS. The value/price/ratio
+    factories return one shared marker per scale key.
+    """
 
     def __init__(self, key: str):
-        self.key = key
+        self.key = sys.intern(key)  # used as a products lookup key on every scaled field
 
     @classmethod
+    @lru_cache(maxsize=None)
     def value(cls):
         return cls("valueScale")
 
     @classmethod
+    @lru_cache(maxsize=None)
     def price(cls):
         return cls("priceScale")
 
     @classmethod
+    @lru_cache(maxsize=None)
     def ratio(cls):
         return cls("ratioScale")
 
 
+@lru_cache(maxsize=None)
+def _scale_factor(exponent: int) -> Decimal:
+    """10 ** exponent as an exact Decimal; products only use a handful of distinct scales."""
+    return Decimal(10) ** exponent
+
+
 class PhemexDecimal(Decimal):
     @classmethod
     def validate(cls, v) -> Self:
         if isinstance(v, cls):
             return v
-        return cls(str(v))
+        return cls(v)
 
     @classmethod
     def sum(cls, values: list[Self]) -> Self:
-        return reduce(lambda x, y: x + y, values, cls(0))
+        # accumulate with plain Decimal addition and wrap once at the end
+        total = Decimal(0)
+        for v in values:
+            total = Decimal.__add__(total, cls._coerce_operand(v))
+        return cls(total)
 
     # managed by pydantic
 
@@ -121,13 +141,19 @@ class PhemexDecimal(Decimal):
 
     @staticmethod
     def _str(v: Decimal) -> str:
-        # avoid scientific notation, match Phemex API expectations
-        return format(v, "f")
+        # avoid scientific notation, match Phemex API expectations; str() is much
+        # cheaper than format() and already plain for most values
+        s = str(v)
+        return s if "E" not in s else format(v, "f")
 
     # force strong internal override of Decimal
 
     def __new__(cls, value: int | float | str | Decimal = "0", *args, **kwargs):
-        return super().__new__(cls, str(value))
+        # Decimal takes str, int and Decimal as-is; anything else (notably float) goes
+        # through str() so 0.1 stays 0.1 rather than its binary expansion
+        if type(value) not in (str, int) and not isinstance(value, Decimal):
+            value = str(value)
+        return super().__new__(cls, value)
 
     def __repr__(self):
         return f"PhemexDecimal('{self.__str__()}')"
@@ -136,12 +162,15 @@ class PhemexDecimal(Decimal):
 
     @classmethod
     def _convert(cls, result):
-        if isinstance(result, Decimal) and not isinstance(result, cls):
+        # Decimal arithmetic always returns exact Decimal instances
+        if type(result) is Decimal:
             return cls(result)
         return result
 
-    @classmethod
-    def _coerce_operand(cls, other):
+    @staticmethod
+    def _coerce_operand(other):
+        if type(other) is PhemexDecimal or type(other) is int:
+            return other
         if isinstance(other, float):
             other = Decimal(str(other))
         elif isinstance(other, str):
@@ -236,14 +265,26 @@ class PhemexDecimal(Decimal):
     def __abs__(self) -> Self:
         return self._convert(super().__abs__())
 
-    def __eq__(self, other) -> Self:
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Decimal):
+            return Decimal.__eq__(self, other)
         operand = self._coerce_operand(other)
         return super().__eq__(operand)
 
+    # __eq__ coerces str/float operands, which hash differently from the equal Decimal, so
+    # the class is deliberately left unhashable (overriding __eq__ sets __hash__ to None)
+
 
 PhemexDecimalLike: TypeAlias = PhemexDecimal | Decimal | str | int | float
 
 
+class _LazyProducts:
+    """Class-level descriptor that defers loading products.json until a model first needs it."""
+
+    def __get__(self, instance: Any, owner: type) -> dict:
+        return get_products()
+
+
 class PhemexModel(BaseModel):
     """
     Base model that all Phemex API models should inherit from. Phemex uses a custom number system which is powered by
@@ -255,7 +296,8 @@ class PhemexModel(BaseModel):
     Subclass PhemexRequest for extra="forbid" (catches user mistakes) or
     PhemexResponse for extra="ignore" (tolerates new API fields).
     """
-    __products__ = get_products()
+    __products__ = _LazyProducts()
+    __phemex_scaled_fields__: ClassVar[tuple[tuple[str, str, str], ...]]
     model_config: ClassVar[ConfigDict] = ConfigDict(
         extra="ignore",
         frozen=True,
@@ -263,36 +305,60 @@ class PhemexModel(BaseModel):
         serialize_by_alias=True,
         validate_by_alias=True,
         validate_by_name=True,
+        defer_build=True,
     )
 
-    def autoscale(self, mode: Literal["serialize", "validate"]):
-        fields = self.__class__.model_fields
-        for name, field in fields.items():
+    @classmethod
+    def _scaled_fields(cls) -> tuple[tuple[str, str, str], ...]:
+        """
+        (name, serialized key, scale key) for every PhemexScale field, computed once per
+        model class on first use, when model_fields are complete.
+        """
+        scaled = cls.__dict__.get("__phemex_scaled_fields__")
+        if scaled is None:
+            scaled = []
+            for name, field in cls.model_fields.items():
+                scale_meta = next((m for m in field.metadata if isinstance(m, PhemexScale)), None)
+                if scale_meta and scale_meta.key:
+                    scaled.append((name, field.serialization_alias or field.alias or name, scale_meta.key))
+            scaled = tuple(scaled)
+            cls.__phemex_scaled_fields__ = scaled
+        return scaled
+
+    def _product_for(self, mode: str, name: str, value: Any, scale_key: str) -> dict:
+        """Look up the product entry for this model's symbol, raising if the symbol is missing or unknown."""
+        symbol = getattr(self, "symbol", None)
+        futures = self.__products__.get("futures")
+        product = futures.get(symbol) if symbol and futures else None
+        if product is None:
+            raise ValidationError(
+                message=f"Cannot {mode} PhemexDecimal field {name} without valid symbol",
+                context={
+                    "field": name,
+                    "value": value,
+                    "symbol": symbol,
+                    "scale_key": scale_key,
+                    "available_symbols": list(futures.keys()) if futures else None,
+                }
+            )
+        return product
+
+    def _iter_scaled(self, mode: Literal["serialize", "validate"]) -> Iterator[tuple[str, str, PhemexDecimal]]:
+        """Yield (name, serialized key, scaled value) for every scaled field that has a value."""
+        product = None  # resolved once, on the first scaled field with a value
+        for name, serialized_key, scale_key in self._scaled_fields():
             value = getattr(self, name)
             if value is None:
                 continue
 
-            scale_meta = next((m for m in field.metadata if isinstance(m, PhemexScale)), None)
-            if not scale_meta or not scale_meta.key:
-                continue
+            if product is None:
+                product = self._product_for(mode, name, value, scale_key)
+            scale = product[scale_key]
+            factor = _scale_factor(scale if mode == "serialize" else -scale)
+            yield name, serialized_key, PhemexDecimal.validate(value * factor)
 
-            symbol = getattr(self, "symbol", None)
-            futures = self.__products__.get("futures")
-            if not symbol or symbol not in futures:
-                raise ValidationError(
-                    message=f"Cannot {mode} PhemexDecimal field {name} without valid symbol",
-                    context={
-                        "field": name,
-                        "value": value,
-                        "symbol": symbol,
-                        "scale_key": scale_meta.key,
-                        "available_symbols": list(futures.keys()) if futures else None,
-                    }
-                )
-
-            scale = futures[symbol][scale_meta.key]
-            factor = 10 ** scale if mode == "serialize" else 10 ** -scale
-            new_value = PhemexDecimal.validate(value * factor)
+    def autoscale(self, mode: Literal["serialize", "validate"]):
+        for name, _, new_value in self._iter_scaled(mode):
             object.__setattr__(self, name, new_value)
 
     @model_validator(mode="wrap")
@@ -302,9 +368,11 @@ class PhemexModel(BaseModel):
         Run normal Pydantic validation first, then apply Phemex scaling.
         """
         model = handler(data)
-        model.autoscale("validate")
+        if model._scaled_fields():  # most models have nothing to scale
+            model.autoscale("validate")
 
-        logger.debug(f"Final validated model: {model}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Final validated model: {model}")
         return model
 
     @model_serializer(mode="wrap", when_used="always")
@@ -319,39 +387,14 @@ class PhemexModel(BaseModel):
         """
         out = handler(self)
 
-        fields = self.__class__.model_fields
-        for name, field in fields.items():
-            value = getattr(self, name)
-            if value is None:
-                continue
-
-            scale_meta = next((m for m in field.metadata if isinstance(m, PhemexScale)), None)
-            if not scale_meta or not scale_meta.key:
-                continue
+        if self._scaled_fields():
+            for _, serialized_key, scaled_value in self._iter_scaled("serialize"):
+                if serialized_key in out:
+                    out[serialized_key] = PhemexDecimal._str(scaled_value)
 
-            symbol = getattr(self, "symbol", None)
-            futures = self.__products__.get("futures")
-            if not symbol or symbol not in futures:
-                raise ValidationError(
-                    message=f"Cannot serialize PhemexDecimal field {name} without valid symbol",
-                    context={
-                        "field": name,
-                        "value": value,
-                        "symbol": symbol,
-                        "scale_key": scale_meta.key,
-                        "available_symbols": list(futures.keys()) if futures else None,
-                    }
-                )
-
-            scale = futures[symbol][scale_meta.key]
-            scaled_value = PhemexDecimal._str(PhemexDecimal.validate(value * 10 ** scale))
-
-            serialized_key = field.serialization_alias or field.alias or name
-            if serialized_key in out:
-                out[serialized_key] = scaled_value
-
-        logger.debug(f"Serialization instructions: {info}")
-        logger.debug(f"Final serialized output: {out}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Serialization instructions: {info}")
+            logger.debug(f"Final serialized output: {out}")
         return out
 
 
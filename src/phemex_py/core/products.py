@@ -1,11 +1,17 @@
-import json
+from functools import lru_cache
 from importlib.resources import files
 
+from .json import loads
 
+
+@lru_cache(maxsize=None)
 def get_products() -> dict:
     """
     Simple helper function to retrieve product data from our locally stored processed JSON file.
     This is a robust-enough solution for now until we have full automation with the API.
+
+    The file is parsed once (from bytes, skipping a separate decode step) and the same dict
+    is returned on every call.
     """
-    data = files("phemex_py").joinpath("products.json").read_text(encoding="utf-8")
-    return json.loads(data)
+    data = files("phemex_py").joinpath("products.json").read_bytes()
+    return loads(data)
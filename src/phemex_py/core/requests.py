@@ -1,13 +1,25 @@
-import json
+import re
+from collections.abc import Callable
 from typing import Any, Literal, Self
 from urllib.parse import quote
 
 from pydantic import BaseModel
 
+from .json import dumps
 from .models import PhemexModel
 
 type RequestData = dict[str, Any] | PhemexModel | None
 
+_BOOL_STR = {True: "true", False: "false"}
+# characters quote(..., safe="") never escapes; most values (symbols, numbers, ids) are all unreserved
+_is_unreserved = re.compile(r"[A-Za-z0-9_.~-]*").fullmatch
+
+
+def _query_value(v: Any) -> str:
+    """Percent-encode a single query value, rendering booleans the way Phemex expects."""
+    s = _BOOL_STR[v] if type(v) is bool else str(v)
+    return s if _is_unreserved(s) else quote(s, safe="")
+
 
 class Request(BaseModel):
     """Helper to build Phemex API requests."""
@@ -33,7 +45,7 @@ class Request(BaseModel):
         if not body:
             return ""
 
-        return json.dumps(body, separators=(",", ":"))
+        return dumps(body)
 
     def build_query_string(self) -> str:
         """Build deterministic query string WITHOUT leading '?'"""
@@ -44,38 +56,66 @@ class Request(BaseModel):
         parts = []
         for k, v in params.items():
             if isinstance(v, list):
-                for item in v:  # repeat the key for each value
-                    if isinstance(item, bool):
-                        item = str(item).lower()
-                    parts.append(f"{k}={quote(str(item), safe='')}")
+                parts.extend(f"{k}={_query_value(item)}" for item in v)  # repeat the key for each value
             else:
-                if isinstance(v, bool):
-                    v = str(v).lower()
-                parts.append(f"{k}={quote(str(v), safe='')}")
+                parts.append(f"{k}={_query_value(v)}")
 
         return "&".join(parts)
 
     # ----------- factory methods -----------
+    # The factories fix `method` themselves and are typed, so they skip pydantic
+    # validation via model_construct; instantiate Request directly to validate.
+
     @classmethod
     def get(cls, path: str, params: RequestData = None):
-        return cls(method="GET", path=path, params=params)
+        return cls.model_construct(method="GET", path=path, params=params)
 
     @classmethod
     def post(cls, path: str, body: RequestData = None, params: RequestData = None):
-        return cls(method="POST", path=path, body=body, params=params)
+        return cls.model_construct(method="POST", path=path, body=body, params=params)
 
     @classmethod
     def put(cls, path: str, params: RequestData = None, body: RequestData = None):
-        return cls(method="PUT", path=path, params=params, body=body)
+        return cls.model_construct(method="PUT", path=path, params=params, body=body)
 
     @classmethod
     def delete(cls, path: str, params: RequestData = None):
-        return cls(method="DELETE", path=path, params=params)
+        return cls.model_construct(method="DELETE", path=path, params=params)
+
+
+def _key(result, key: str):
+    return result[key] if isinstance(result, dict) else result
+
+
+def _index(result, index: int):
+    if not isinstance(result, list):
+        return result
+    if index >= len(result):
+        raise IndexError("List index out of range")
+    return result[index]
+
+
+def _slice(result, window: slice):
+    return result[window] if isinstance(result, list) else result
+
+
+def extract(resp, *keys: str):
+    """
+    Walk dict keys from the response root, e.g. extract(resp, "data", "rows"). Same result
+    as Extractor(resp).key(*keys).extract() without building an Extractor.
+    """
+    result = resp
+    for k in keys:
+        if isinstance(result, dict):
+            result = result[k]
+    return result
 
 
 class Extractor:
     """
     Helper to extract data from nested API responses. Supports chaining operations.
+    Operations are recorded as (function, argument) pairs and applied in order;
+    an operation that doesn't match the current value's type is skipped.
     """
 
     def __init__(self, resp: dict):
@@ -84,20 +124,20 @@ class Extractor:
         :param resp: response result (JSON) from the API
         """
         self.resp = resp
-        self.operations: list[str | int] = []
+        self.operations: list[tuple[Callable[[Any, Any], Any], str | int | slice]] = []
 
     def key(self, *key: str) -> Self:
         """
         Extract a value by key from a dictionary.
         """
-        self.operations.extend(key)
+        self.operations.extend((_key, k) for k in key)
         return self
 
     def first(self) -> Self:
         """
         Extract the first element from a list.
         """
-        self.operations.append(0)
+        self.operations.append((_index, 0))
         return self
 
     def head(self, n: int) -> Self:
@@ -105,7 +145,7 @@ class Extractor:
         Extract the first n elements from a list. Returns a list, unlike
         first() which returns the element itself.
         """
-        self.operations.append(slice(n))
+        self.operations.append((_slice, slice(n)))
         return self
 
     def extract(self):
@@ -113,17 +153,8 @@ class Extractor:
         Execute the extraction operations on the response data.
         """
         result = self.resp
-        for op in self.operations:
-            if isinstance(op, str) and isinstance(result, dict):
-                result = result[op]
-
-            elif isinstance(op, int) and isinstance(result, list):
-                if op >= len(result):
-                    raise IndexError("List index out of range")
-                result = result[op]
-
-            elif isinstance(op, slice) and isinstance(result, list):
-                result = result[op]
+        for op, arg in self.operations:
+            result = op(result, arg)
 
         return result
 
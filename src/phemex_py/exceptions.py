@@ -34,12 +34,20 @@ class AuthenticationError(PhemexError):
 class PhemexAPIError(PhemexError):
     """Business-level error returned by the Phemex API (code != 0)."""
 
-    def __init__(self, code: int, msg: str, data: dict | None = None):
+    def __init__(
+        self,
+        code: int,
+        msg: str,
+        data: dict | None = None,
+        cause: Exception | None = None,
+        context: dict | None = None,
+    ):
         self.code = code
         self.msg = msg
         super().__init__(
             message=f"[{code}] {msg}",
-            context={"code": code, "msg": msg, "data": data},
+            cause=cause,
+            context={"code": code, "msg": msg, "data": data, **(context or {})},
         )
 
 
@@ -87,9 +95,9 @@ _ERROR_CODE_MAP: dict[int, type[PhemexAPIError]] = {
 
 def raise_for_business_error(data: dict) -> None:
     """Raise a typed PhemexAPIError if the response envelope contains a non-zero code."""
-    if not isinstance(data, dict) or "code" not in data:
+    if not isinstance(data, dict):
         return
-    code = data["code"]
+    code = data.get("code", 0)  # single lookup on the common success path; missing code counts as success
     if code == 0:
         return
     msg = data.get("msg", "Unknown error")
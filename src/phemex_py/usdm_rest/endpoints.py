@@ -1,8 +1,15 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
 from typing_extensions import deprecated
 
-from ..core.requests import Request, Extractor
+from pydantic import TypeAdapter
+
+from ..core.requests import Request, extract
+from ..exceptions import ValidationError
 from .models import *
 
 if TYPE_CHECKING:
@@ -10,6 +17,26 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+_PRODUCTS_TTL = 300.0  # seconds; product metadata changes rarely
+
+# Parameterless requests are identical on every call; they are never mutated, so share one
+# instance instead of rebuilding them.
+_PRODUCTS = Request.get("/public/products")
+_PRODUCTS_PLUS = Request.get("/public/products-plus")
+_RISK_UNIT = Request.get("/g-accounts/risk-unit")
+_TICKERS_ALL = Request.get("/md/v3/ticker/24hr/all")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """
+    Validate a whole list response in one pydantic-core call. Built on first use so the
+    model schemas stay deferred until an endpoint actually needs them.
+    """
+    return TypeAdapter(list[model])
+
 
 class USDMRest:
     """
@@ -21,18 +48,28 @@ class USDMRest:
 
     def __init__(self, client: "PhemexClient") -> None:
         self.client = client
+        self._products: tuple[float, ProductResponse] | None = None  # (fetched at, response)
 
-    def product_information(self) -> ProductResponse:
+    def product_information(self, *, refresh: bool = False) -> ProductResponse:
         """
         Fetch product information for all USD-M perpetual contracts. For details, see:
         https://phemex-docs.github.io/#query-product-information-2
 
+        The response is cached on this client for _PRODUCTS_TTL seconds; pass refresh=True
+        to bypass the cache.
+
         NOTE: this is a public endpoint and does not require authentication.
         """
-        req = Request.get("/public/products")
+        cached = self._products
+        if not refresh and cached and time.monotonic() - cached[0] < _PRODUCTS_TTL:
+            return cached[1]
+
+        req = _PRODUCTS
         resp = self.client.request(req)
-        data = Extractor(resp).data()
-        return ProductResponse.model_validate(data)
+        data = extract(resp, "data")
+        products = ProductResponse.model_validate(data)
+        self._products = (time.monotonic(), products)
+        return products
 
     def product_information_plus(self):
         """
@@ -41,7 +78,7 @@ class USDMRest:
 
         NOTE: this is a public endpoint and does not require authentication.
         """
-        req = Request.get("/public/products-plus")
+        req = _PRODUCTS_PLUS
         resp = self.client.request(req)
         raise NotImplementedError("Response schema not yet defined, use 'product_information' endpoint for now.")
 
@@ -53,7 +90,7 @@ class USDMRest:
         """
         req = Request.put("/g-orders/create", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     def place_order(self, request: PlaceOrderRequest) -> OrderResponse | None:
@@ -63,9 +100,38 @@ class USDMRest:
         """
         req = Request.post("/g-orders", body=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
+    def bulk_place_orders(
+        self,
+        requests: list[PlaceOrderRequest],
+        *,
+        max_concurrency: int = 10,
+    ) -> list[OrderResponse | None | Exception]:
+        """
+        Place several orders concurrently (one place_order call each) on a thread pool sharing
+        the client's connection pool. Phemex has no batch order endpoint, so this saves round
+        trips rather than requests; keep max_concurrency within your account's rate limit.
+
+        Results are returned in request order; a failed order yields its exception instead of
+        raising, so one rejection doesn't hide the outcome of the others.
+        """
+        if max_concurrency < 1:
+            raise ValidationError(
+                message="max_concurrency must be at least 1",
+                context={"max_concurrency": max_concurrency},
+            )
+
+        def _place(request: PlaceOrderRequest) -> OrderResponse | None | Exception:
+            try:
+                return self.place_order(request)
+            except Exception as exc:
+                return exc
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            return list(pool.map(_place, requests))
+
     def amend_order(self, request: AmendOrderRequest) -> OrderResponse | None:
         """
         Amend an existing USD-M perpetual order. For details, see:
@@ -73,7 +139,7 @@ class USDMRest:
         """
         req = Request.put("/g-orders/replace", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     def cancel_order(self, request: CancelOrderRequest) -> OrderResponse | None:
@@ -83,7 +149,7 @@ class USDMRest:
         """
         req = Request.delete("/g-orders/cancel", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     def bulk_cancel(self, request: BulkCancelOrderRequest) -> list[OrderResponse]:
@@ -93,8 +159,8 @@ class USDMRest:
         """
         req = Request.delete("/g-orders", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
-        return [OrderResponse.model_validate(item) for item in data]
+        data = extract(resp, "data")
+        return _list_adapter(OrderResponse).validate_python(data)
 
     def cancel_all(
         self,
@@ -129,7 +195,7 @@ class USDMRest:
         """
         req = Request.get("/g-accounts/accountPositions", params={"currency": currency})
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return PositionResponse.model_validate(data)
 
     def positions_with_pnl(self, currency: str = "USDT") -> PositionWithPnLResponse:
@@ -141,7 +207,7 @@ class USDMRest:
         """
         req = Request.get("/g-accounts/positions", params={"currency": currency})
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return PositionWithPnLResponse.model_validate(data)
 
     def risk_units(self) -> list[RiskUnitResponse]:
@@ -157,10 +223,10 @@ class USDMRest:
         is analogous to "account margin usage summary" in other derivatives
         APIs, but Phemex's term is "risk unit."
         """
-        req = Request.get("/g-accounts/risk-unit")
+        req = _RISK_UNIT
         resp = self.client.request(req)
-        data = Extractor(resp).data()
-        return [RiskUnitResponse.model_validate(item) for item in data]
+        data = extract(resp, "data")
+        return _list_adapter(RiskUnitResponse).validate_python(data)
 
     def switch_position_mode(self, request: SwitchModeRequest) -> None:
         """
@@ -217,10 +283,10 @@ class USDMRest:
         """
         req = Request.get("/g-orders/activeList", params={"symbol": symbol})
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [OpenOrder.model_validate(item) for item in data["rows"]]
+        return _list_adapter(OpenOrder).validate_python(data["rows"])
 
     def closed_orders(self, request: ClosedOrdersRequest) -> list[ClosedOrder]:
         """
@@ -229,10 +295,10 @@ class USDMRest:
         """
         req = Request.get("/exchange/order/v2/orderList", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [ClosedOrder.model_validate(item) for item in data]
+        return _list_adapter(ClosedOrder).validate_python(data)
 
     def closed_positions(self, request: ClosedPositionRequest) -> list[ClosedPosition]:
         """
@@ -241,10 +307,10 @@ class USDMRest:
         """
         req = Request.get("/api-data/g-futures/closedPosition", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [ClosedPosition.model_validate(item) for item in data]
+        return _list_adapter(ClosedPosition).validate_python(data)
 
     def user_trades(self, request: UserTradeRequest) -> list[UserTrade]:
         """
@@ -253,10 +319,10 @@ class USDMRest:
         """
         req = Request.get("/exchange/order/v2/tradingList", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [UserTrade.model_validate(item) for item in data]
+        return _list_adapter(UserTrade).validate_python(data)
 
     def order_book(self, symbol: str) -> OrderBookResponse:
         """
@@ -265,7 +331,7 @@ class USDMRest:
         """
         req = Request.get("/md/v2/orderbook", params={"symbol": symbol})
         resp = self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return OrderBookResponse.model_validate(data)
 
     def klines(self, request: KlineRequest) -> list[Kline]:
@@ -275,10 +341,10 @@ class USDMRest:
         """
         req = Request.get("/exchange/public/md/v2/kline/last", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [Kline.model_validate(item) for item in data["rows"]]
+        return _list_adapter(Kline).validate_python(data["rows"])
 
     def trades(self, symbol: str) -> TradeResponse:
         """
@@ -287,7 +353,7 @@ class USDMRest:
         """
         req = Request.get("/md/v2/trade", params={"symbol": symbol})
         resp = self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return TradeResponse.model_validate(data)
 
     def ticker(self, symbol: str) -> Ticker:
@@ -299,7 +365,7 @@ class USDMRest:
         """
         req = Request.get("/md/v3/ticker/24hr", params={"symbol": symbol})
         resp = self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return Ticker.model_validate(data)
 
     def tickers(self) -> list[Ticker]:
@@ -309,10 +375,10 @@ class USDMRest:
 
         NOTE: this uses the newer v3 endpoint, v2 is no longer supported.
         """
-        req = Request.get("/md/v3/ticker/24hr/all")
+        req = _TICKERS_ALL
         resp = self.client.request(req)
-        data = Extractor(resp).key("result").extract()
-        return [Ticker.model_validate(item) for item in data]
+        data = extract(resp, "result")
+        return _list_adapter(Ticker).validate_python(data)
 
     def order_history(self, symbol: str) -> list[OrderHistoryItem]:
         """
@@ -321,10 +387,10 @@ class USDMRest:
         """
         req = Request.get("/api-data/g-futures/orders", params={"symbol": symbol})
         resp = self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [OrderHistoryItem.model_validate(item) for item in data]
+        return _list_adapter(OrderHistoryItem).validate_python(data)
 
     def lookup_order(self, symbol: str, order_id: str) -> OpenOrder | None:
         """
@@ -334,10 +400,10 @@ class USDMRest:
         params = {"symbol": symbol, "orderID": order_id}
         req = Request.get("/api-data/g-futures/orders/by-order-id", params=params)
         resp = self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None or len(data) == 0:
             return None
-        return OpenOrder.model_validate(data.pop())
+        return OpenOrder.model_validate(data[-1])
 
     def trade_history(self, request: TradeHistoryRequest) -> list[TradeHistoryItem]:
         """
@@ -346,10 +412,10 @@ class USDMRest:
         """
         req = Request.get("/api-data/g-futures/trades", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [TradeHistoryItem.model_validate(item) for item in data]
+        return _list_adapter(TradeHistoryItem).validate_python(data)
 
     def funding_fee_history(self, request: FundingFeeRequest) -> list[FundingFeeItem]:
         """
@@ -358,10 +424,10 @@ class USDMRest:
         """
         req = Request.get("/api-data/g-futures/funding-fees", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [FundingFeeItem.model_validate(item) for item in data]
+        return _list_adapter(FundingFeeItem).validate_python(data)
 
     def funding_rates(self, request: FundingRateRequest) -> list[FundingRateItem]:
         """
@@ -370,10 +436,10 @@ class USDMRest:
         """
         req = Request.get("/contract-biz/public/real-funding-rates", params=request)
         resp = self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [FundingRateItem.model_validate(item) for item in data]
+        return _list_adapter(FundingRateItem).validate_python(data)
 
 
 class AsyncUSDMRest:
@@ -386,18 +452,30 @@ class AsyncUSDMRest:
 
     def __init__(self, client: "AsyncPhemexClient") -> None:
         self.client = client
+        self._products: tuple[float, ProductResponse] | None = None  # (fetched at, response)
+        self._products_lock = asyncio.Lock()
 
-    async def product_information(self) -> ProductResponse:
+    async def product_information(self, *, refresh: bool = False) -> ProductResponse:
         """
         Fetch product information for all USD-M perpetual contracts. For details, see:
         https://phemex-docs.github.io/#query-product-information-2
 
+        The response is cached on this client for _PRODUCTS_TTL seconds; pass refresh=True
+        to bypass the cache. Concurrent callers on a cache miss share a single fetch.
+
         NOTE: this is a public endpoint and does not require authentication.
         """
-        req = Request.get("/public/products")
-        resp = await self.client.request(req)
-        data = Extractor(resp).data()
-        return ProductResponse.model_validate(data)
+        async with self._products_lock:
+            cached = self._products
+            if not refresh and cached and time.monotonic() - cached[0] < _PRODUCTS_TTL:
+                return cached[1]
+
+            req = _PRODUCTS
+            resp = await self.client.request(req)
+            data = extract(resp, "data")
+            products = ProductResponse.model_validate(data)
+            self._products = (time.monotonic(), products)
+            return products
 
     async def product_information_plus(self):
         """
@@ -406,7 +484,7 @@ class AsyncUSDMRest:
 
         NOTE: this is a public endpoint and does not require authentication.
         """
-        req = Request.get("/public/products-plus")
+        req = _PRODUCTS_PLUS
         await self.client.request(req)
         raise NotImplementedError("Response schema not yet defined, use 'product_information' endpoint for now.")
 
@@ -418,7 +496,7 @@ class AsyncUSDMRest:
         """
         req = Request.put("/g-orders/create", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     async def place_order(self, request: PlaceOrderRequest) -> OrderResponse | None:
@@ -428,9 +506,37 @@ class AsyncUSDMRest:
         """
         req = Request.post("/g-orders", body=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
+    async def bulk_place_orders(
+        self,
+        requests: list[PlaceOrderRequest],
+        *,
+        max_concurrency: int = 10,
+    ) -> list[OrderResponse | None | BaseException]:
+        """
+        Place several orders concurrently (one place_order call each). Phemex has no batch
+        order endpoint, so this saves round trips rather than requests; keep max_concurrency
+        within your account's rate limit.
+
+        Results are returned in request order; a failed order yields its exception instead of
+        raising, so one rejection doesn't hide the outcome of the others.
+        """
+        if max_concurrency < 1:
+            raise ValidationError(
+                message="max_concurrency must be at least 1",
+                context={"max_concurrency": max_concurrency},
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _place(request: PlaceOrderRequest) -> OrderResponse | None:
+            async with semaphore:
+                return await self.place_order(request)
+
+        return await asyncio.gather(*(_place(r) for r in requests), return_exceptions=True)
+
     async def amend_order(self, request: AmendOrderRequest) -> OrderResponse | None:
         """
         Amend an existing USD-M perpetual order. For details, see:
@@ -438,7 +544,7 @@ class AsyncUSDMRest:
         """
         req = Request.put("/g-orders/replace", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     async def cancel_order(self, request: CancelOrderRequest) -> OrderResponse | None:
@@ -448,7 +554,7 @@ class AsyncUSDMRest:
         """
         req = Request.delete("/g-orders/cancel", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return OrderResponse.model_validate(data) if data else None
 
     async def bulk_cancel(self, request: BulkCancelOrderRequest) -> list[OrderResponse]:
@@ -458,8 +564,8 @@ class AsyncUSDMRest:
         """
         req = Request.delete("/g-orders", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
-        return [OrderResponse.model_validate(item) for item in data]
+        data = extract(resp, "data")
+        return _list_adapter(OrderResponse).validate_python(data)
 
     async def cancel_all(
         self,
@@ -473,19 +579,34 @@ class AsyncUSDMRest:
 
         :param symbol: Single symbol, list of symbols, or None to cancel all.
         :param include_triggered: If True (default), also cancel triggered orders
-            via a second API call.
+            via a second API call, sent concurrently with the first. Both calls
+            always run to completion; if either fails its error is raised, and if
+            both fail the untriggered error is raised with the triggered one
+            attached as its __context__ and a note.
         """
         if symbol is None:
             logger.warning("cancel_all called without symbol — this will cancel ALL orders")
 
         untriggered = CancelAllOrdersRequest.make(symbol=symbol, untriggered=True)
         req_1 = Request.delete("/g-orders/all", params=untriggered)
-        await self.client.request(req_1)
-
-        if include_triggered:
-            triggered = CancelAllOrdersRequest.make(symbol=symbol, untriggered=False)
-            req_2 = Request.delete("/g-orders/all", params=triggered)
-            await self.client.request(req_2)
+        if not include_triggered:
+            await self.client.request(req_1)
+            return
+
+        # the two cancels are independent, so send them concurrently; let both finish so a failed
+        # untriggered cancel can't hide the outcome of the triggered one
+        triggered = CancelAllOrdersRequest.make(symbol=symbol, untriggered=False)
+        req_2 = Request.delete("/g-orders/all", params=triggered)
+        results = await asyncio.gather(
+            self.client.request(req_1), self.client.request(req_2), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if len(errors) == 2:
+            # same exception types as the sync client, without losing the triggered failure
+            errors[0].__context__ = errors[1]
+            errors[0].add_note(f"The triggered-orders cancel also failed: {errors[1]!r}")
+        if errors:
+            raise errors[0]
 
     async def positions(self, currency: str = "USDT") -> PositionResponse:
         """
@@ -494,7 +615,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/g-accounts/accountPositions", params={"currency": currency})
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return PositionResponse.model_validate(data)
 
     async def positions_with_pnl(self, currency: str = "USDT") -> PositionWithPnLResponse:
@@ -506,7 +627,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/g-accounts/positions", params={"currency": currency})
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         return PositionWithPnLResponse.model_validate(data)
 
     async def risk_units(self) -> list[RiskUnitResponse]:
@@ -514,10 +635,10 @@ class AsyncUSDMRest:
         Fetch risk unit information. For details, see:
         https://phemex-docs.github.io/#query-risk-unit
         """
-        req = Request.get("/g-accounts/risk-unit")
+        req = _RISK_UNIT
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
-        return [RiskUnitResponse.model_validate(item) for item in data]
+        data = extract(resp, "data")
+        return _list_adapter(RiskUnitResponse).validate_python(data)
 
     async def switch_position_mode(self, request: SwitchModeRequest) -> None:
         """
@@ -565,10 +686,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/g-orders/activeList", params={"symbol": symbol})
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [OpenOrder.model_validate(item) for item in data["rows"]]
+        return _list_adapter(OpenOrder).validate_python(data["rows"])
 
     async def closed_orders(self, request: ClosedOrdersRequest) -> list[ClosedOrder]:
         """
@@ -577,10 +698,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/exchange/order/v2/orderList", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [ClosedOrder.model_validate(item) for item in data]
+        return _list_adapter(ClosedOrder).validate_python(data)
 
     async def closed_positions(self, request: ClosedPositionRequest) -> list[ClosedPosition]:
         """
@@ -589,10 +710,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/api-data/g-futures/closedPosition", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [ClosedPosition.model_validate(item) for item in data]
+        return _list_adapter(ClosedPosition).validate_python(data)
 
     async def user_trades(self, request: UserTradeRequest) -> list[UserTrade]:
         """
@@ -601,10 +722,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/exchange/order/v2/tradingList", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [UserTrade.model_validate(item) for item in data]
+        return _list_adapter(UserTrade).validate_python(data)
 
     async def order_book(self, symbol: str) -> OrderBookResponse:
         """
@@ -613,7 +734,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/md/v2/orderbook", params={"symbol": symbol})
         resp = await self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return OrderBookResponse.model_validate(data)
 
     async def klines(self, request: KlineRequest) -> list[Kline]:
@@ -623,10 +744,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/exchange/public/md/v2/kline/last", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).data()
+        data = extract(resp, "data")
         if data is None:
             return []
-        return [Kline.model_validate(item) for item in data["rows"]]
+        return _list_adapter(Kline).validate_python(data["rows"])
 
     async def trades(self, symbol: str) -> TradeResponse:
         """
@@ -635,7 +756,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/md/v2/trade", params={"symbol": symbol})
         resp = await self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return TradeResponse.model_validate(data)
 
     async def ticker(self, symbol: str) -> Ticker:
@@ -647,7 +768,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/md/v3/ticker/24hr", params={"symbol": symbol})
         resp = await self.client.request(req)
-        data = Extractor(resp).key("result").extract()
+        data = extract(resp, "result")
         return Ticker.model_validate(data)
 
     async def tickers(self) -> list[Ticker]:
@@ -657,10 +778,10 @@ class AsyncUSDMRest:
 
         NOTE: this uses the newer v3 endpoint, v2 is no longer supported.
         """
-        req = Request.get("/md/v3/ticker/24hr/all")
+        req = _TICKERS_ALL
         resp = await self.client.request(req)
-        data = Extractor(resp).key("result").extract()
-        return [Ticker.model_validate(item) for item in data]
+        data = extract(resp, "result")
+        return _list_adapter(Ticker).validate_python(data)
 
     async def order_history(self, symbol: str) -> list[OrderHistoryItem]:
         """
@@ -669,10 +790,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/api-data/g-futures/orders", params={"symbol": symbol})
         resp = await self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [OrderHistoryItem.model_validate(item) for item in data]
+        return _list_adapter(OrderHistoryItem).validate_python(data)
 
     async def lookup_order(self, symbol: str, order_id: str) -> OpenOrder | None:
         """
@@ -682,10 +803,10 @@ class AsyncUSDMRest:
         params = {"symbol": symbol, "orderID": order_id}
         req = Request.get("/api-data/g-futures/orders/by-order-id", params=params)
         resp = await self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None or len(data) == 0:
             return None
-        return OpenOrder.model_validate(data.pop())
+        return OpenOrder.model_validate(data[-1])
 
     async def trade_history(self, request: TradeHistoryRequest) -> list[TradeHistoryItem]:
         """
@@ -694,10 +815,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/api-data/g-futures/trades", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [TradeHistoryItem.model_validate(item) for item in data]
+        return _list_adapter(TradeHistoryItem).validate_python(data)
 
     async def funding_fee_history(self, request: FundingFeeRequest) -> list[FundingFeeItem]:
         """
@@ -706,10 +827,10 @@ class AsyncUSDMRest:
         """
         req = Request.get("/api-data/g-futures/funding-fees", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [FundingFeeItem.model_validate(item) for item in data]
+        return _list_adapter(FundingFeeItem).validate_python(data)
 
     async def funding_rates(self, request: FundingRateRequest) -> list[FundingRateItem]:
         """
@@ -718,7 +839,7 @@ class AsyncUSDMRest:
         """
         req = Request.get("/contract-biz/public/real-funding-rates", params=request)
         resp = await self.client.request(req)
-        data = Extractor(resp).key("data", "rows").extract()
+        data = extract(resp, "data", "rows")
         if data is None:
             return []
-        return [FundingRateItem.model_validate(item) for item in data]
+        return _list_adapter(FundingRateItem).validate_python(data)
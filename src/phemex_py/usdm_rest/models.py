@@ -535,11 +535,12 @@ class ClosedOrdersRequest(PhemexRequest):
 
     @classmethod
     def default(cls, symbol: str, currency: str = "USDT") -> Self:
+        now = unix_now()
         return cls(
             symbol=symbol,
             currency=currency,
-            start_time=unix_now() - MS.WEEK,
-            end_time=unix_now() - MS.MINUTE,
+            start_time=now - MS.WEEK,
+            end_time=now - MS.MINUTE,
             offset=0,
             limit=200,
         )
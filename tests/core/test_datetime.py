@@ -6,18 +6,12 @@ import phemex_py.core.datetime as dt
 
 class TestUnixConversion:
     def test_unix_now(self, monkeypatch):
-        fake_now = datetime.datetime(2025, 1, 1, 0, 0, tzinfo=datetime.timezone.utc)
+        fake_now = datetime.datetime(2025, 1, 1, 0, 0, 0, 123456, tzinfo=datetime.timezone.utc)
+        fake_ns = int(fake_now.timestamp()) * 1_000_000_000 + 123_456_000
 
-        # Patch .now() specifically
-        class DummyDatetime(datetime.datetime):
-            @classmethod
-            def now(cls, tz=None):
-                return fake_now
-
-        # The module uses `import datetime` (the stdlib module), then `datetime.datetime.now(...)`.
-        # We patch the `datetime` class attribute on the stdlib module as seen by the target module.
+        # The module reads the clock via `time.time_ns()`, so patch it as seen by the target module.
         import phemex_py.core.datetime as _dt_mod
-        monkeypatch.setattr(_dt_mod.datetime, "datetime", DummyDatetime)
+        monkeypatch.setattr(_dt_mod.time, "time_ns", lambda: fake_ns)
 
         result_ms = dt.unix_now(ms=True)
         result_s = dt.unix_now(ms=False)
@@ -43,6 +37,14 @@ class TestUnixConversion:
         parsed = dt.iso_to_unix(iso_str, ms=True)
         assert parsed == ts_ms
 
+    def test_batch_conversions_match_scalar(self):
+        ts_ms = [1_700_000_000_000, 1_700_000_060_000, 1_700_003_600_000]
+        iso_strs = dt.unix_to_iso_batch(ts_ms, ms=True)
+
+        assert iso_strs == [dt.unix_to_iso(ts, ms=True) for ts in ts_ms]
+        assert dt.iso_to_unix_batch(iso_strs, ms=True) == ts_ms
+        assert dt.iso_to_unix_batch(iso_strs, ms=False) == [ts // 1000 for ts in ts_ms]
+
 
 class TestDatetimeConversion:
     def test_datetime_to_iso_and_back(self):
@@ -52,6 +54,27 @@ class TestDatetimeConversion:
         parsed_dt = dt.iso_to_datetime(iso_str)
         assert parsed_dt == aware_dt
 
+    def test_iso_to_datetime_phemex_format(self):
+        iso_str = "2025-01-01T12:34:56.789Z"
+        expected = datetime.datetime(2025, 1, 1, 12, 34, 56, 789000, tzinfo=datetime.timezone.utc)
+
+        assert dt.iso_to_datetime(iso_str) == expected
+        assert dt.iso_to_datetime(iso_str) == datetime.datetime.fromisoformat(iso_str)
+
+    def test_iso_to_datetime_phemex_format_invalid_raises(self):
+        with pytest.raises(ValueError):
+            dt.iso_to_datetime("2025-13-01T12:34:56.789Z")
+
+    @pytest.mark.parametrize(
+        "iso_str",
+        ["2025-01-01T00:00:00.1_2Z", "+025-01-01T00:00:00.000Z", "2025-01-01T0 :00:00.000Z"],
+    )
+    def test_iso_to_datetime_malformed_phemex_shape_raises(self, iso_str):
+        with pytest.raises(ValueError):
+            datetime.datetime.fromisoformat(iso_str)
+        with pytest.raises(ValueError):
+            dt.iso_to_datetime(iso_str)
+
     def test_datetime_to_iso_raises_on_naive(self):
         naive = datetime.datetime(2025, 1, 1, 12, 0)  # no tzinfo
         with pytest.raises(ValueError):
@@ -231,6 +231,41 @@ class TestRateLimitParsing:
         assert client.rate_limit.remaining == 0
         assert client.rate_limit.retry_after == 30
 
+    def test_http_429_raises_rate_limit_error(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        request = httpx.Request("GET", "https://test/test")
+        resp = httpx.Response(status_code=429, headers={"retry-after": "2"}, text="Too Many Requests", request=request)
+        from phemex_py.core.requests import Request
+        req = Request.get("/test")
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            client._handle_response(resp, req, "https://test/test", None)
+
+        assert exc_info.value.code == 429
+        assert exc_info.value.context["retry_after"] == 2
+        assert exc_info.value.context["request"] == {"method": "GET", "url": "https://test/test", "body": None}
+        assert exc_info.value.context["response"] == {"status_code": 429, "text": "Too Many Requests"}
+        assert isinstance(exc_info.value.cause, httpx.HTTPStatusError)
+        assert isinstance(exc_info.value, PhemexError)
+
+    def test_http_429_retry_after_comes_from_that_response_in_seconds(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        request = httpx.Request("GET", "https://test/test")
+        from phemex_py.core.requests import Request
+        req = Request.get("/test")
+
+        resp = httpx.Response(
+            status_code=429, headers={"x-ratelimit-retry-after-milliseconds": "1500"}, request=request
+        )
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            client._handle_response(resp, req, "https://test/test", None)
+        assert exc_info.value.context["retry_after"] == 1.5
+
+        resp = httpx.Response(status_code=429, request=request)
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            client._handle_response(resp, req, "https://test/test", None)
+        assert exc_info.value.context["retry_after"] is None
+
     def test_rate_limit_info_dataclass(self):
         info = RateLimitInfo()
         assert info.limit is None
@@ -0,0 +1,28 @@
+import pytest
+
+import phemex_py.core.json as pjson
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(pjson, "orjson", None)
+    elif pjson.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+class TestJson:
+    def test_dumps_is_compact(self, backend):
+        assert pjson.dumps({"symbol": "BTCUSDT", "qty": [1, 2], "reduceOnly": False}) == \
+            '{"symbol":"BTCUSDT","qty":[1,2],"reduceOnly":false}'
+
+    def test_loads_round_trips_bytes(self, backend):
+        assert pjson.loads(b'{"code":0,"data":{"a":1}}') == {"code": 0, "data": {"a": 1}}
+
+    @pytest.mark.parametrize("value", [-2**63, 2**63 - 1, 2**64 - 1])
+    def test_64_bit_integers_round_trip_exactly(self, backend, value):
+        encoded = pjson.dumps({"value": value})
+        assert encoded == f'{{"value":{value}}}'
+        decoded = pjson.loads(encoded.encode())["value"]
+        assert decoded == value and type(decoded) is int
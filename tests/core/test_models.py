@@ -1,3 +1,4 @@
+import pydantic
 import pytest
 from decimal import Decimal
 from typing import Annotated
@@ -19,6 +20,52 @@ class TestPhemexDecimal:
         assert isinstance(d3, core.PhemexDecimal)
         assert isinstance(d4, core.PhemexDecimal)
 
+    def test_phemex_decimal_float_keeps_short_repr(self):
+        assert core.PhemexDecimal(0.1) == Decimal("0.1")
+        assert str(core.PhemexDecimal(Decimal("1.50"))) == "1.50"
+
+    def test_phemex_decimal_sum(self):
+        total = core.PhemexDecimal.sum([core.PhemexDecimal("1.5"), core.PhemexDecimal("2.25"), 3])
+        assert isinstance(total, core.PhemexDecimal)
+        assert total == Decimal("6.75")
+        assert core.PhemexDecimal.sum([]) == Decimal("0")
+
+    def test_phemex_decimal_str_never_uses_scientific_notation(self):
+        assert core.PhemexDecimal._str(Decimal("12345")) == "12345"
+        assert core.PhemexDecimal._str(Decimal("123.45")) == "123.45"
+        assert core.PhemexDecimal._str(Decimal("1E+2")) == "100"
+        assert core.PhemexDecimal._str(Decimal("1E-8")) == "0.00000001"
+
+    def test_phemex_decimal_compares_with_decimal_and_is_unhashable(self):
+        price = core.PhemexDecimal("123.45")
+        assert price == Decimal("123.45")
+        assert price == "123.45"
+        with pytest.raises(TypeError):
+            hash(price)
+
+
+class TestOptions:
+    def test_options_validator_accepts_allowed_and_none(self):
+        class Dummy(core.PhemexModel):
+            order: Annotated[str | None, core.options(None, "asc", "desc")] = None
+
+        assert Dummy.model_validate({"order": "asc"}).order == "asc"
+        assert Dummy.model_validate({"order": "None"}).order is None
+
+    def test_options_validator_rejects_unknown(self):
+        class Dummy(core.PhemexModel):
+            order: Annotated[str | None, core.options(None, "asc", "desc")] = None
+
+        with pytest.raises(pydantic.ValidationError, match="Must be one of"):
+            Dummy.model_validate({"order": "sideways"})
+
+
+class TestPhemexScale:
+    def test_factories_return_shared_markers(self):
+        assert core.PhemexScale.price() is core.PhemexScale.price()
+        assert core.PhemexScale.value().key == "valueScale"
+        assert core.PhemexScale.ratio() is not core.PhemexScale.value()
+
 
 class TestPhemexModel:
     def test_model_with_fixed_decimal_field(self):
@@ -49,6 +96,20 @@ class TestPhemexModel:
         # should rescale back to int-string
         assert dumped["price"] == "12345.00"
 
+    def test_products_are_loaded_once_and_shared(self):
+        from phemex_py.core.products import get_products
+        assert core.PhemexModel.__products__ is get_products()
+        assert "BTCUSDT" in core.PhemexModel.__products__["futures"]
+
+    def test_scaled_fields_are_collected_once_per_class(self):
+        class Dummy(core.PhemexModel):
+            symbol: str
+            price: Annotated[core.PhemexDecimal, core.PhemexScale.price()]
+            qty: core.PhemexDecimal
+
+        assert Dummy._scaled_fields() == (("price", "price", "priceScale"),)
+        assert Dummy._scaled_fields() is Dummy._scaled_fields()
+
     def test_actual_model(self):
         # semi-integration test with actual model
         m = PlaceOrderRequest.builder("BTCUSDT").increase_long(1).limit(12345).build()
@@ -1,5 +1,7 @@
+import pytest
+
 from phemex_py.core.models import PhemexModel, PhemexDecimal
-from phemex_py.core.requests import Request
+from phemex_py.core.requests import Extractor, Request, extract
 
 
 class TestPhemexRequest:
@@ -20,3 +22,31 @@ class TestPhemexRequest:
         req = Request.post("/test", body={"foo": "bar"})
         body_str = req.build_body_json()
         assert body_str == '{"foo":"bar"}'
+
+    def test_request_serializes_current_contents(self):
+        req = Request.post("/test", body={"foo": "bar"}, params={"symbol": "BTCUSDT", "untriggered": True})
+
+        assert req.build_query_string() == "symbol=BTCUSDT&untriggered=true"
+        assert req.build_body_json() == '{"foo":"bar"}'
+
+    def test_query_string_repeats_list_keys_and_lowercases_bools(self):
+        req = Request.get("/test", params={"ids": [1, True, "a b"], "untriggered": False})
+        assert req.build_query_string() == "ids=1&ids=true&ids=a%20b&untriggered=false"
+
+
+class TestExtractor:
+    def test_chained_operations(self):
+        resp = {"data": {"rows": [{"id": 1}, {"id": 2}, {"id": 3}]}}
+        assert Extractor(resp).key("data", "rows").first().key("id").extract() == 1
+        assert Extractor(resp).key("data", "rows").head(2).extract() == [{"id": 1}, {"id": 2}]
+
+    def test_extract_matches_key_extract(self):
+        resp = {"data": {"rows": [1, 2]}, "result": {"a": 1}}
+        assert extract(resp, "data", "rows") == Extractor(resp).key("data", "rows").extract()
+        assert extract(resp, "result") == {"a": 1}
+        assert extract(resp, "data", "rows") == [1, 2]
+        assert extract(resp, "data") is resp["data"]
+
+    def test_first_on_empty_list_raises(self):
+        with pytest.raises(IndexError):
+            Extractor({"data": []}).key("data").first().extract()
@@ -0,0 +1,86 @@
+import hashlib
+import hmac
+
+import pytest
+
+from phemex_py.client import BasePhemexClient
+from phemex_py.core.requests import Request
+from phemex_py.exceptions import ValidationError
+
+
+def _reference_signature(secret: str, path: str, query: str, expires: str, body: str) -> str:
+    payload = f"{path}{query}{expires}{body}".encode("utf-8")
+    return hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+
+
+class TestRequestSigning:
+    def test_signature_matches_reference_hmac(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        req = Request.get("/g-orders/activeList", params={"symbol": "BTCUSDT"})
+
+        url, headers, _, _ = client._prepare(req)
+
+        expected = _reference_signature(
+            "secret", "/g-orders/activeList", "symbol=BTCUSDT", headers["x-phemex-request-expiry"], ""
+        )
+        assert headers["x-phemex-request-signature"] == expected
+        assert url == "https://testnet-api.phemex.com/g-orders/activeList?symbol=BTCUSDT"
+
+    def test_signature_includes_body(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        req = Request.post("/g-orders", body={"symbol": "BTCUSDT", "side": "Buy"})
+
+        _, headers, content, body_json = client._prepare(req)
+
+        body = '{"symbol":"BTCUSDT","side":"Buy"}'
+        expected = _reference_signature("secret", "/g-orders", "", headers["x-phemex-request-expiry"], body)
+        assert headers["x-phemex-request-signature"] == expected
+        assert headers["Content-Type"] == "application/json"
+        assert content == body.encode("utf-8")
+        assert body_json == body
+
+    def test_signature_covers_non_ascii_path_and_body(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        req = Request.post("/g-orders/café", body={"text": "ordre d'achat €"})
+
+        _, headers, content, body_json = client._prepare(req)
+
+        expected = _reference_signature(
+            "secret", "/g-orders/café", "", headers["x-phemex-request-expiry"], body_json
+        )
+        assert headers["x-phemex-request-signature"] == expected
+        assert content == body_json.encode("utf-8")
+
+    def test_mutated_request_is_resigned_with_new_params(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        req = Request.get("/g-orders/activeList", params={"symbol": "BTCUSDT"})
+        client._prepare(req)
+
+        req.params = {"symbol": "SOLUSDT"}
+        url, headers, _, _ = client._prepare(req)
+
+        expected = _reference_signature(
+            "secret", "/g-orders/activeList", "symbol=SOLUSDT", headers["x-phemex-request-expiry"], ""
+        )
+        assert url.endswith("?symbol=SOLUSDT")
+        assert headers["x-phemex-request-signature"] == expected
+
+    def test_copied_request_is_signed_with_updated_params(self):
+        client = BasePhemexClient(kind="test", api_key="key", api_secret="secret")
+        req = Request.get("/g-orders/activeList", params={"symbol": "BTCUSDT"})
+        client._prepare(req)
+
+        copy = req.model_copy(update={"params": {"symbol": "ETHUSDT"}})
+        url, _, _, _ = client._prepare(copy)
+
+        assert url.endswith("?symbol=ETHUSDT")
+
+
+class TestClientKind:
+    def test_known_kind_sets_base_url(self):
+        client = BasePhemexClient(kind="vip", api_key="key", api_secret="secret")
+        assert client.base_url == "https://vapi.phemex.com"
+
+    def test_unknown_kind_raises_validation_error(self):
+        with pytest.raises(ValidationError, match="Unknown Phemex kind"):
+            BasePhemexClient(kind="prod", api_key="key", api_secret="secret")  # type: ignore[arg-type]
@@ -0,0 +1,190 @@
+"""
+Tests for the USD-M REST endpoint helpers: concurrent cancel_all, bulk_place_orders,
+the product information cache and the cached list adapters.
+"""
+import asyncio
+import pytest
+from decimal import Decimal
+from typing import Annotated
+from unittest.mock import MagicMock
+
+from phemex_py.core.models import PhemexModel, PhemexResponse, PhemexDecimal, PhemexScale
+from phemex_py.exceptions import DuplicateOrderError, OrderNotFoundError, RateLimitExceededError, ValidationError
+from phemex_py.usdm_rest import endpoints
+from phemex_py.usdm_rest.endpoints import AsyncUSDMRest, USDMRest, _list_adapter
+from phemex_py.usdm_rest.models import PlaceOrderRequest
+
+
+class TestAsyncCancelAll:
+    class _FakeClient:
+        def __init__(self):
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.requests = []
+
+        async def request(self, req):
+            self.requests.append(req)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return {"code": 0, "msg": "", "data": None}
+
+    @pytest.mark.asyncio
+    async def test_triggered_and_untriggered_sent_concurrently(self):
+        client = self._FakeClient()
+        await AsyncUSDMRest(client).cancel_all("BTCUSDT")
+
+        assert [r.params.untriggered for r in client.requests] == [True, False]
+        assert client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_untriggered_only(self):
+        client = self._FakeClient()
+        await AsyncUSDMRest(client).cancel_all("BTCUSDT", include_triggered=False)
+
+        assert [r.params.untriggered for r in client.requests] == [True]
+
+    @pytest.mark.asyncio
+    async def test_single_failure_is_raised_after_both_complete(self):
+        client = self._FakeClient()
+        request = client.request
+
+        async def _fail_untriggered(req):
+            await request(req)
+            if req.params.untriggered:
+                raise OrderNotFoundError(code=10002, msg="not found")
+
+        client.request = _fail_untriggered
+        with pytest.raises(OrderNotFoundError):
+            await AsyncUSDMRest(client).cancel_all("BTCUSDT")
+        assert [r.params.untriggered for r in client.requests] == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_both_failures_raise_first_with_second_attached(self):
+        client = self._FakeClient()
+        request = client.request
+
+        async def _fail(req):
+            await request(req)
+            if req.params.untriggered:
+                raise OrderNotFoundError(code=10002, msg="not found")
+            raise RateLimitExceededError(code=429, msg="Too Many Requests")
+
+        client.request = _fail
+        with pytest.raises(OrderNotFoundError) as exc_info:
+            await AsyncUSDMRest(client).cancel_all("BTCUSDT")
+
+        assert isinstance(exc_info.value.__context__, RateLimitExceededError)
+        assert "triggered-orders cancel also failed" in exc_info.value.__notes__[0]
+
+
+class TestBulkPlaceOrders:
+    @staticmethod
+    def _orders():
+        return [PlaceOrderRequest.builder("BTCUSDT").increase_long(1).limit(p).build() for p in (100, 200, 300)]
+
+    @staticmethod
+    def _respond(req):
+        if req.body.price == Decimal("200"):
+            raise DuplicateOrderError(code=35014, msg="dup")
+        return {"code": 0, "msg": "", "data": None}
+
+    def test_sync_returns_results_in_order_with_exceptions(self):
+        client = MagicMock()
+        client.request.side_effect = self._respond
+
+        results = USDMRest(client).bulk_place_orders(self._orders(), max_concurrency=2)
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], DuplicateOrderError)
+
+    @pytest.mark.asyncio
+    async def test_async_returns_results_in_order_with_exceptions(self):
+        respond = self._respond
+
+        class _Client:
+            async def request(self, req):
+                return respond(req)
+
+        results = await AsyncUSDMRest(_Client()).bulk_place_orders(self._orders(), max_concurrency=2)
+
+        assert results[0] is None and results[2] is None
+        assert isinstance(results[1], DuplicateOrderError)
+
+    def test_sync_rejects_non_positive_concurrency(self):
+        client = MagicMock()
+
+        with pytest.raises(ValidationError):
+            USDMRest(client).bulk_place_orders(self._orders(), max_concurrency=0)
+        client.request.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_rejects_non_positive_concurrency(self):
+        client = MagicMock()
+
+        with pytest.raises(ValidationError):
+            await AsyncUSDMRest(client).bulk_place_orders(self._orders(), max_concurrency=0)
+        client.request.assert_not_called()
+
+
+class TestProductInformationCache:
+    def test_sync_cached_until_refresh(self, monkeypatch):
+        monkeypatch.setattr(endpoints, "ProductResponse", MagicMock())
+        client = MagicMock()
+        client.request.return_value = {"code": 0, "msg": "", "data": {}}
+        rest = USDMRest(client)
+
+        first = rest.product_information()
+        assert rest.product_information() is first
+        assert client.request.call_count == 1
+
+        rest.product_information(refresh=True)
+        assert client.request.call_count == 2
+
+    def test_sync_expires_after_ttl(self, monkeypatch):
+        monkeypatch.setattr(endpoints, "ProductResponse", MagicMock())
+        client = MagicMock()
+        client.request.return_value = {"code": 0, "msg": "", "data": {}}
+        rest = USDMRest(client)
+
+        rest.product_information()
+        fetched_at, products = rest._products
+        rest._products = (fetched_at - endpoints._PRODUCTS_TTL - 1, products)
+        rest.product_information()
+        assert client.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_misses_share_one_fetch(self, monkeypatch):
+        monkeypatch.setattr(endpoints, "ProductResponse", MagicMock())
+
+        class _Client:
+            calls = 0
+
+            async def request(self, req):
+                self.calls += 1
+                await asyncio.sleep(0)
+                return {"code": 0, "msg": "", "data": {}}
+
+        client = _Client()
+        rest = AsyncUSDMRest(client)
+
+        results = await asyncio.gather(*(rest.product_information() for _ in range(5)))
+        assert client.calls == 1
+        assert all(r is results[0] for r in results)
+
+
+class TestListAdapter:
+    def test_list_validation_matches_model_validate(self, monkeypatch):
+        monkeypatch.setitem(PhemexModel.__products__, "futures", {"BTCUSDT": {"priceScale": 2}})
+
+        class Item(PhemexResponse):
+            symbol: str
+            price: Annotated[PhemexDecimal, PhemexScale.price()]
+
+        rows = [{"symbol": "BTCUSDT", "price": "12345"}, {"symbol": "BTCUSDT", "price": "100"}]
+        items = _list_adapter(Item).validate_python(rows)
+
+        assert items == [Item.model_validate(row) for row in rows]
+        assert items[0].price == Decimal("123.45")
+        assert _list_adapter(Item) is _list_adapter(Item)